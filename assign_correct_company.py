@@ -1,5 +1,6 @@
 # This script will assign the correct company to the tasks in the project
 
+import gzip
 import json
 import sys
 from typing import Dict, List, Optional
@@ -13,7 +14,9 @@ def load_asana_data(json_file_path: str) -> Dict:
     """Load Asana export JSON file"""
     try:
         logger.info(f"Loading Asana data from: {json_file_path}")
-        with open(json_file_path, 'r', encoding='utf-8') as f:
+        # Exports may be gzip-compressed (asana_export_*.json.gz)
+        open_func = gzip.open if json_file_path.endswith('.gz') else open
+        with open_func(json_file_path, 'rt', encoding='utf-8') as f:
             data = json.load(f)
         logger.info(f"Loaded Asana data: Project '{data.get('project', {}).get('name', 'Unknown')}' with {len(data.get('tasks', []))} tasks")
         return data
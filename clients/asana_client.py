@@ -7,7 +7,7 @@ from typing import Dict, List, Optional
 import asana
 from asana.rest import ApiException
 
-from config import ENV_ASANA_ACCESS_TOKEN
+from config import ENV_ASANA_ACCESS_TOKEN, HTTP_POOL_MAXSIZE
 from utils import logger, retry_with_backoff, rate_limit
 
 
@@ -36,6 +36,8 @@ class AsanaClient:
         # Initialize Asana API client using Configuration and ApiClient
         self.configuration = asana.Configuration()
         self.configuration.access_token = self.access_token
+        # Size the SDK's urllib3 pool for parallel requests (the SDK defaults to cpu_count * 5)
+        self.configuration.connection_pool_maxsize = HTTP_POOL_MAXSIZE
         self.api_client = asana.ApiClient(self.configuration)
         
         # Initialize API instances
@@ -207,6 +209,33 @@ class AsanaClient:
             logger.error(f"Error retrieving project details: {e}")
             raise
     
+    @retry_with_backoff()
+    @rate_limit
+    def get_project_task_count(self, project_gid: str) -> int:
+        """
+        Get the number of tasks in a project with a single task_counts request
+        
+        Args:
+            project_gid: Project GID
+        
+        Returns:
+            Number of tasks in the project, or 0 if it could not be determined
+        """
+        try:
+            opts = {
+                'opt_fields': 'num_tasks'
+            }
+            task_counts = self.projects_api.get_task_counts_for_project(project_gid, opts)
+            task_counts_dict = task_counts.to_dict() if hasattr(task_counts, 'to_dict') else dict(task_counts)
+            return int(task_counts_dict.get('num_tasks') or 0)
+        except ApiException as e:
+            status = e.status if hasattr(e, 'status') else 'Unknown'
+            logger.warning(f"API error retrieving task count for project {project_gid} (Status {status}): {e}")
+            return 0
+        except Exception as e:
+            logger.warning(f"Error retrieving task count for project {project_gid}: {e}")
+            return 0
+    
     @retry_with_backoff()
     @rate_limit
     def get_tasks_for_section(self, section_gid: str) -> List[Dict]:
@@ -3,11 +3,18 @@ Scoro API client for interacting with Scoro API
 """
 import html
 import os
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
 
-from config import ENV_SCORO_API_KEY, ENV_SCORO_COMPANY_NAME
+try:
+    import orjson
+except ImportError:
+    # orjson not available, will use the standard json parser from requests
+    orjson = None
+
+from config import ENV_SCORO_API_KEY, ENV_SCORO_COMPANY_NAME, HTTP_POOL_MAXSIZE
 from utils import logger, retry_with_backoff, rate_limit
 
 
@@ -51,6 +58,17 @@ class ScoroClient:
             'Content-Type': 'application/json'
         }
         
+        # Shared session so every call reuses pooled keep-alive connections instead of a new TCP/TLS handshake
+        # Pool size is matched to the number of parallel workers so concurrent calls don't queue for a connection
+        # Retries stay in retry_with_backoff (adapter-level retries would re-send non-idempotent POSTs)
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=HTTP_POOL_MAXSIZE, pool_maxsize=HTTP_POOL_MAXSIZE)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        # Ask for compressed responses explicitly (requests decompresses them transparently);
+        # per-call headers are merged with the session headers, so no call can drop it
+        self.session.headers['Accept-Encoding'] = 'gzip, deflate'
+        
         # Caching for performance optimization
         self._users_cache = None  # Cache for users list
         self._companies_cache = None  # Cache for companies list
@@ -76,6 +94,57 @@ class ScoroClient:
             "request": request_data
         }
     
+    @staticmethod
+    def _parse_json(response: requests.Response):
+        """
+        Parse a JSON response body, using orjson when it is installed
+        
+        Args:
+            response: Response from the Scoro API
+        
+        Returns:
+            Parsed JSON data
+        """
+        if orjson is not None:
+            try:
+                return orjson.loads(response.content)
+            except orjson.JSONDecodeError:
+                # Let requests raise its own JSONDecodeError (a RequestException) as before
+                pass
+        return response.json()
+    
+    def ping(self) -> bool:
+        """
+        Test the Scoro API connection with a single one-item projects page
+        
+        Much cheaper than list_projects(), which pages through every project in the account.
+        
+        Returns:
+            True if connection is successful, False otherwise
+        """
+        try:
+            request_body = {**self._build_request_body({}), "page": "1", "per_page": "1"}
+            response = self.session.post(
+                f'{self.base_url}projects/list',
+                headers=self.headers,
+                json=request_body
+            )
+            response.raise_for_status()
+            result = response.json()
+            
+            if isinstance(result, dict) and result.get('status') == 'ERROR':
+                error_msg = result.get('messages', {}).get('error', ['Unknown error'])
+                logger.error(f"Scoro connection test failed: {error_msg}")
+                return False
+            
+            logger.info("Scoro connection test successful")
+            return True
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Scoro connection test failed: {e}")
+            if hasattr(e, 'response') and e.response is not None:
+                logger.debug(f"Response: {e.response.text}")
+            return False
+    
     def list_projects(self) -> List[Dict]:
         """
         List all existing projects in Scoro
@@ -123,7 +192,7 @@ class ScoroClient:
                     headers_without_auth = {
                         'Content-Type': 'application/json'
                     }
-                    response = requests.post(
+                    response = self.session.post(
                         f'{self.base_url}{endpoint}',
                         headers=headers_without_auth,
                         json=request_body
@@ -248,7 +317,7 @@ class ScoroClient:
             else:
                 endpoint = 'projects/modify'
             
-            response = requests.post(
+            response = self.session.post(
                 f'{self.base_url}{endpoint}',
                 headers=self.headers,
                 json=request_body
@@ -291,7 +360,7 @@ class ScoroClient:
             endpoint = f'projects/view/{project_id}'
             request_body = self._build_request_body({})
             
-            response = requests.post(
+            response = self.session.post(
                 f'{self.base_url}{endpoint}',
                 headers=self.headers,
                 json=request_body
@@ -317,6 +386,63 @@ class ScoroClient:
                 logger.debug(f"Response: {e.response.text}")
             return None
     
+    @retry_with_backoff()
+    @rate_limit
+    def get_projects(self, project_ids: List[int]) -> Dict[int, Dict]:
+        """
+        Get several projects by ID from Scoro in a single projects/list request
+        
+        Args:
+            project_ids: Project IDs to fetch
+        
+        Returns:
+            Dictionary mapping project ID to project dictionary. Projects that
+            were not returned are missing from the result, so callers can fall
+            back to get_project for them.
+        """
+        if not project_ids:
+            return {}
+        
+        try:
+            endpoint = 'projects/list'
+            request_body = {
+                **self._build_request_body({"filters": {"project_id": list(project_ids)}}),
+                "page": "1",
+                "per_page": str(len(project_ids))
+            }
+            
+            response = self.session.post(
+                f'{self.base_url}{endpoint}',
+                headers=self.headers,
+                json=request_body
+            )
+            response.raise_for_status()
+            result = self._parse_json(response)
+            
+            if isinstance(result, dict):
+                if result.get('status') == 'ERROR':
+                    error_msg = result.get('messages', {}).get('error', ['Unknown error'])
+                    logger.warning(f"Error getting projects {project_ids}: {error_msg}")
+                    return {}
+                projects = result.get('data', [])
+            else:
+                projects = result
+            
+            wanted = set(project_ids)
+            projects_by_id = {}
+            for project in projects if isinstance(projects, list) else []:
+                project_id = project.get('project_id') or project.get('id')
+                if project_id in wanted:
+                    projects_by_id[project_id] = project
+            
+            logger.debug(f"Retrieved {len(projects_by_id)}/{len(wanted)} projects in one request")
+            return projects_by_id
+        except requests.exceptions.RequestException as e:
+            logger.warning(f"Error getting Scoro projects {project_ids}: {e}")
+            if hasattr(e, 'response') and e.response is not None:
+                logger.debug(f"Response: {e.response.text}")
+            return {}
+    
     @retry_with_backoff()
     @rate_limit
     def add_phase_to_project(self, project_id: int, phase_name: str, 
@@ -411,7 +537,7 @@ class ScoroClient:
             else:
                 endpoint = 'tasks/modify'
             
-            response = requests.post(
+            response = self.session.post(
                 f'{self.base_url}{endpoint}',
                 headers=self.headers,
                 json=request_body
@@ -468,7 +594,7 @@ class ScoroClient:
             else:
                 endpoint = 'projectPhases/modify'
             
-            response = requests.post(
+            response = self.session.post(
                 f'{self.base_url}{endpoint}',
                 headers=self.headers,
                 json=request_body
@@ -554,7 +680,7 @@ class ScoroClient:
                         headers_without_auth = {
                             'Content-Type': 'application/json'
                         }
-                        response = requests.post(
+                        response = self.session.post(
                             f'{self.base_url}{endpoint}',
                             headers=headers_without_auth,
                             json=request_body
@@ -775,7 +901,7 @@ class ScoroClient:
             else:
                 endpoint = 'companies/modify'
             
-            response = requests.post(
+            response = self.session.post(
                 f'{self.base_url}{endpoint}',
                 headers=self.headers,
                 json=request_body
@@ -889,7 +1015,7 @@ class ScoroClient:
                     headers_without_auth = {
                         'Content-Type': 'application/json'
                     }
-                    response = requests.post(
+                    response = self.session.post(
                         f'{self.base_url}{endpoint}',
                         headers=headers_without_auth,
                         json=request_body
@@ -968,7 +1094,7 @@ class ScoroClient:
             
             logger.debug(f"Trying POST to endpoint '{endpoint}'")
             
-            response = requests.post(
+            response = self.session.post(
                 f'{self.base_url}{endpoint}',
                 headers=self.headers,
                 json=request_body
@@ -1080,7 +1206,7 @@ class ScoroClient:
             else:
                 endpoint = 'comments/modify'
             
-            response = requests.post(
+            response = self.session.post(
                 f'{self.base_url}{endpoint}',
                 headers=self.headers,
                 json=request_body
@@ -1136,7 +1262,7 @@ class ScoroClient:
             else:
                 endpoint = 'timeEntries/modify'
             
-            response = requests.post(
+            response = self.session.post(
                 f'{self.base_url}{endpoint}',
                 headers=self.headers,
                 json=request_body
@@ -1325,7 +1451,7 @@ class ScoroClient:
                     headers_without_auth = {
                         'Content-Type': 'application/json'
                     }
-                    response = requests.post(
+                    response = self.session.post(
                         f'{self.base_url}{endpoint}',
                         headers=headers_without_auth,
                         json=request_body
@@ -1591,7 +1717,7 @@ class ScoroClient:
                         headers_without_auth = {
                             'Content-Type': 'application/json'
                         }
-                        response = requests.post(
+                        response = self.session.post(
                             f'{self.base_url}{endpoint}',
                             headers=headers_without_auth,
                             json=request_body
@@ -1928,7 +2054,7 @@ class ScoroClient:
             request_body = self._build_request_body({})
             
             try:
-                response = requests.post(
+                response = self.session.post(
                     f'{self.base_url}{endpoint}',
                     headers=self.headers,
                     json=request_body
@@ -1971,7 +2097,7 @@ class ScoroClient:
             
             request_body = self._build_request_body(request_data)
             
-            response = requests.post(
+            response = self.session.post(
                 f'{self.base_url}{endpoint}',
                 headers=self.headers,
                 json=request_body
@@ -1997,21 +2123,48 @@ class ScoroClient:
             return False
     
     @retry_with_backoff()
-    @rate_limit
-    def list_tasks(self, project_id: Optional[int] = None, filters: Optional[Dict] = None) -> List[Dict]:
+    def list_tasks(self, project_id: Optional[int] = None, filters: Optional[Dict] = None,
+                   fields: Optional[List[str]] = None) -> List[Dict]:
         """
         List all tasks in Scoro with optional filtering
         
         Args:
             project_id: Optional project ID to filter tasks by project
             filters: Optional dictionary of additional filters to apply
+            fields: Optional list of task fields to return (all fields if None)
         
         Returns:
-            List of task dictionaries
+            List of task dictionaries (empty if any page request fails)
+        """
+        try:
+            return list(self.iter_tasks(project_id=project_id, filters=filters, fields=fields))
+        except requests.exceptions.RequestException:
+            # iter_tasks already logged the error; never return a partial listing
+            return []
+    
+    @rate_limit
+    def iter_tasks(self, project_id: Optional[int] = None, filters: Optional[Dict] = None,
+                   fields: Optional[List[str]] = None, page_size: int = 100) -> Iterator[Dict]:
+        """
+        Iterate over tasks in Scoro page by page with optional filtering
+        
+        Only the current page is held in memory, so callers can filter tasks as they
+        arrive instead of materializing the whole task list. A failed page request is
+        re-raised after the earlier pages were yielded, so callers must not treat the
+        tasks they received before the error as the complete listing.
+        
+        Args:
+            project_id: Optional project ID to filter tasks by project
+            filters: Optional dictionary of additional filters to apply
+            fields: Optional list of task fields to return (all fields if None)
+            page_size: Number of tasks to request per page
+        
+        Yields:
+            Task dictionaries
         """
         try:
             endpoint = 'tasks/list'
-            all_tasks = []
+            total_tasks = 0
             page = 1
             max_pages = 1000  # Safety limit to prevent infinite loops
             
@@ -2033,6 +2186,10 @@ class ScoroClient:
             if request_filters:
                 base_request["request"]["filters"] = request_filters
             
+            # Only ask for the fields the caller reads to keep the payload small
+            if fields:
+                base_request["request"]["fields"] = fields
+            
             request_formats = [
                 # Format 1: Standard format per API documentation
                 base_request,
@@ -2061,20 +2218,20 @@ class ScoroClient:
                             request_body = {**request_body, "bookmark": {"bookmark_id": str(bookmark_id)}}
                         # Or try with page/per_page parameters
                         else:
-                            request_body = {**request_body, "page": str(page), "per_page": "100"}
+                            request_body = {**request_body, "page": str(page), "per_page": str(page_size)}
                     
                     try:
                         logger.debug(f"Trying POST to endpoint '{endpoint}' page {page} with filters: {request_filters}")
                         headers_without_auth = {
                             'Content-Type': 'application/json'
                         }
-                        response = requests.post(
+                        response = self.session.post(
                             f'{self.base_url}{endpoint}',
                             headers=headers_without_auth,
                             json=request_body
                         )
                         response.raise_for_status()
-                        data = response.json()
+                        data = self._parse_json(response)
                         
                         # Check if we got an error response
                         if isinstance(data, dict) and data.get('status') == 'ERROR':
@@ -2117,7 +2274,7 @@ class ScoroClient:
                 if data is None:
                     if page == 1:
                         logger.warning("Could not list tasks from Scoro API")
-                        return []
+                        return
                     else:
                         # No more pages - API returned no data for this page
                         logger.debug(f"No data returned for page {page}, stopping pagination")
@@ -2144,11 +2301,12 @@ class ScoroClient:
                     # No more tasks
                     break
                 
-                all_tasks.extend(page_tasks)
-                logger.debug(f"Retrieved {len(page_tasks)} tasks from page {page} (total: {len(all_tasks)})")
+                total_tasks += len(page_tasks)
+                logger.debug(f"Retrieved {len(page_tasks)} tasks from page {page} (total: {total_tasks})")
+                yield from page_tasks
                 
-                # If we got fewer than 100 tasks, we've likely reached the end
-                if len(page_tasks) < 100:
+                # If we got fewer than a full page of tasks, we've likely reached the end
+                if len(page_tasks) < page_size:
                     break
                 
                 # Continue to next page
@@ -2163,11 +2321,10 @@ class ScoroClient:
                     page += 1
                     continue
             
-            logger.info(f"Retrieved {len(all_tasks)} total tasks from Scoro (across {page} page(s))")
-            return all_tasks
+            logger.info(f"Retrieved {total_tasks} total tasks from Scoro (across {page} page(s))")
         except requests.exceptions.RequestException as e:
             logger.warning(f"Error listing Scoro tasks: {e}")
-            return []
+            raise
     
     @retry_with_backoff()
     @rate_limit
@@ -2188,7 +2345,7 @@ class ScoroClient:
             request_body = self._build_request_body({})
             
             try:
-                response = requests.post(
+                response = self.session.post(
                     f'{self.base_url}{endpoint}',
                     headers=self.headers,
                     json=request_body
@@ -2228,7 +2385,7 @@ class ScoroClient:
             
             request_body = self._build_request_body(request_data)
             
-            response = requests.post(
+            response = self.session.post(
                 f'{self.base_url}{endpoint}',
                 headers=self.headers,
                 json=request_body
@@ -2271,7 +2428,7 @@ class ScoroClient:
             
             request_body = self._build_request_body({})
             
-            response = requests.post(
+            response = self.session.post(
                 f'{self.base_url}{endpoint}',
                 headers=self.headers,
                 json=request_body
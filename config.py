@@ -34,12 +34,48 @@ DEFAULT_BATCH_SIZE = 100
 # Set to None to use default (min(32, os.cpu_count() + 4))
 MAX_WORKERS = 10  # Number of parallel workers for concurrent API calls
 
+# HTTP connection pool configuration
+# OPTIMIZATION: Keep at least MAX_WORKERS connections per host so parallel API calls
+# don't serialize waiting for a free connection in the pool (requests/urllib3 default is 10)
+HTTP_POOL_MAXSIZE = 32  # Maximum pooled connections per host for the API clients
+
+# Project ordering configuration
+# OPTIMIZATION: Probe each project's task count up front and migrate the largest projects first
+# (longest-processing-time first), so a huge project doesn't start last and dominate the run time.
+# NOTE: Deduplication keeps the first copy of a task seen between projects of the same type,
+# so changing the order can change which project a shared task is migrated with.
+SORT_PROJECTS_BY_TASK_COUNT = False
+
 # Test mode configuration - limit number of tasks to migrate (set to None to migrate all tasks)
 TEST_MODE_MAX_TASKS = None  # Set to None for PRODUCTION - migrate all tasks
 
+# Export file configuration
+# OPTIMIZATION: Write the per-project Asana export as compact gzip-compressed JSON
+# (asana_export_*.json.gz, typically several times smaller than indented JSON).
+# Set to False to write plain indented asana_export_*.json files instead.
+COMPRESS_EXPORT_FILES = True
+
+# Backup project metadata cache (migration_backup.py)
+# OPTIMIZATION: Backup project details rarely change, so they are cached on disk between runs
+# and only re-fetched from Scoro once older than the TTL. Run with --no-cache to bypass it.
+BACKUP_PROJECT_CACHE_FILE = 'scoro_projects_cache.json'  # Cache file path
+BACKUP_PROJECT_CACHE_TTL = 86400  # Seconds a cached project stays valid (24 hours)
+# OPTIMIZATION: Only the first tasks of each backup project are listed in detail, the rest are counted
+# Override with the BACKUP_TASK_DISPLAY_LIMIT environment variable for verification-heavy runs
+BACKUP_TASK_DISPLAY_LIMIT = 100  # Number of tasks listed in detail per backup project
+
 # Logging configuration
 # Console log level: DEBUG, INFO, WARNING, ERROR, CRITICAL
 CONSOLE_LOG_LEVEL = logging.WARNING  # Log level for console output
+# OPTIMIZATION: File log records are buffered in memory and written in batches
+# The buffer is flushed when it fills up, on any ERROR record, after each project and at exit
+LOG_BUFFER_CAPACITY = 512  # Number of log records buffered before writing to the log file
+# OPTIMIZATION: Only the most recent error messages are kept per migration summary
+# (the failure count still covers every error), so a run with many failures stays bounded in memory
+MAX_SUMMARY_ERRORS = 1000  # Number of error messages kept for the migration summary report
+# OPTIMIZATION: Task transformation progress is logged/printed every N tasks (and for the last task)
+# instead of once per task; per-task details are logged at DEBUG level
+TRANSFORM_PROGRESS_INTERVAL = 100  # Number of tasks between transformation progress messages
 
 
 # Projects to migrate
@@ -536,6 +572,7 @@ USER_MAPPING = {
 ENV_ASANA_ACCESS_TOKEN = 'ASANA_ACCESS_TOKEN'
 ENV_SCORO_API_KEY = 'SCORO_API_KEY'
 ENV_SCORO_COMPANY_NAME = 'SCORO_COMPANY_NAME'
+ENV_BACKUP_TASK_DISPLAY_LIMIT = 'BACKUP_TASK_DISPLAY_LIMIT'
 
 
 # Migration mode: use 'gids' to migrate by GID list, 'names' to migrate by name list
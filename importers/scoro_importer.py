@@ -12,6 +12,16 @@ from models import MigrationSummary
 from utils import logger, process_batch, retry_with_backoff
 from config import DEFAULT_BATCH_SIZE, TEST_MODE_MAX_TASKS, PROFILE_USERNAME_MAPPING, MAX_RETRIES, RETRY_DELAY
 
+# Patterns compiled once at import instead of on every comment:
+# Asana profile URLs (https://app.asana.com/0/profile/{GID}); this matches URLs even inside HTML tags
+_ASANA_PROFILE_RE = re.compile(r'https://app\.asana\.com/0/profile/(\d+)')
+# Literal part of every profile URL, checked before running the regex
+_ASANA_PROFILE_MARKER = 'app.asana.com/0/profile/'
+# Profile GID inside a PROFILE_USERNAME_MAPPING URL
+_PROFILE_GID_RE = re.compile(r'/profile/(\d+)')
+# HTML tags, stripped to check a comment's visible text
+_TAG_STRIP_RE = re.compile(r'<[^>]+>')
+
 
 def replace_asana_profile_urls_with_scoro_mentions(
     comment_text: str,
@@ -40,12 +50,9 @@ def replace_asana_profile_urls_with_scoro_mentions(
     if not comment_text:
         return comment_text
     
-    # Pattern to match Asana profile URLs: https://app.asana.com/0/profile/{GID}
-    # This pattern will match URLs even if they're inside HTML tags
-    asana_profile_pattern = r'https://app\.asana\.com/0/profile/(\d+)'
-    
-    # Check if there are any URLs to replace
-    urls_found = re.findall(asana_profile_pattern, comment_text)
+    # Check if there are any URLs to replace (a plain substring check rules out most comments
+    # before the regex runs)
+    urls_found = _ASANA_PROFILE_RE.findall(comment_text) if _ASANA_PROFILE_MARKER in comment_text else []
     if not urls_found:
         # No URLs found, return as-is
         logger.debug(f"      No Asana profile URLs found in comment text")
@@ -68,7 +75,7 @@ def replace_asana_profile_urls_with_scoro_mentions(
         for mapping in PROFILE_USERNAME_MAPPING:
             mapping_url = mapping.get('asana_url', '')
             # Extract GID from mapping URL
-            mapping_gid_match = re.search(r'/profile/(\d+)', mapping_url)
+            mapping_gid_match = _PROFILE_GID_RE.search(mapping_url)
             if mapping_gid_match:
                 mapping_gid = mapping_gid_match.group(1)
                 if str(mapping_gid) == str(gid):
@@ -149,19 +156,17 @@ def replace_asana_profile_urls_with_scoro_mentions(
         firstname_escaped = html.escape(firstname)
         lastname_escaped = html.escape(lastname) if lastname else ''
         
+        lastname_html = f' <span class="mceNonEditable">{lastname_escaped}</span>' if lastname else ''
         mention_html = (
             f'<span title="{full_name_escaped}" class="mceNonEditable js-tinymce-user tinymce-user user-{user_id}">'
-            f'@<span class="mceNonEditable">{firstname_escaped}</span>'
+            f'@<span class="mceNonEditable">{firstname_escaped}</span>{lastname_html}</span>'
         )
-        if lastname:
-            mention_html += f' <span class="mceNonEditable">{lastname_escaped}</span>'
-        mention_html += '</span>'
         
         logger.debug(f"      Replaced Asana profile URL (GID: {gid}) with Scoro mention for '{full_name}' (user_id: {user_id})")
         return mention_html
     
     # Replace all Asana profile URLs in the comment text
-    result = re.sub(asana_profile_pattern, replace_url, comment_text)
+    result = _ASANA_PROFILE_RE.sub(replace_url, comment_text)
     
     # Check if any replacements were made
     if result != comment_text:
@@ -1115,7 +1120,7 @@ def import_to_scoro(scoro_client: ScoroClient, transformed_data: Dict, summary:
                                         
                                         # Clean HTML from comment text if present
                                         # This removes HTML formatting but preserves plain text URLs
-                                        comment_text = re.sub(r'<[^>]+>', '', comment_text).strip()
+                                        comment_text = _TAG_STRIP_RE.sub('', comment_text).strip()
                                         if not comment_text:
                                             continue
                                         
@@ -1129,7 +1134,7 @@ def import_to_scoro(scoro_client: ScoroClient, transformed_data: Dict, summary:
                                         
                                         # Check if comment is empty after processing (e.g., only HTML was stripped)
                                         # Remove <p> tags for checking, then re-add if needed
-                                        comment_text_check = re.sub(r'<[^>]+>', '', comment_text).strip()
+                                        comment_text_check = _TAG_STRIP_RE.sub('', comment_text).strip()
                                         if not comment_text_check:
                                             logger.debug(f"      Skipping comment: Empty after processing")
                                             continue
@@ -1573,7 +1578,7 @@ def import_to_scoro(scoro_client: ScoroClient, transformed_data: Dict, summary:
                                         if not comment_text:
                                             continue
                                         
-                                        comment_text = re.sub(r'<[^>]+>', '', comment_text).strip()
+                                        comment_text = _TAG_STRIP_RE.sub('', comment_text).strip()
                                         if not comment_text:
                                             continue
                                         
@@ -1583,7 +1588,7 @@ def import_to_scoro(scoro_client: ScoroClient, transformed_data: Dict, summary:
                                             asana_data
                                         )
                                         
-                                        comment_text_check = re.sub(r'<[^>]+>', '', comment_text).strip()
+                                        comment_text_check = _TAG_STRIP_RE.sub('', comment_text).strip()
                                         if not comment_text_check:
                                             continue
                                         
@@ -2,9 +2,12 @@
 Main entry point for Asana to Scoro migration script
 """
 import sys
+import gzip
 import json
 import argparse
+import logging
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 import requests
 
 from clients import AsanaClient, ScoroClient
@@ -12,32 +15,76 @@ from models import MigrationSummary
 from exporters import export_asana_project
 from transformers import transform_data, reset_task_tracker, get_deduplication_stats
 from importers import import_to_scoro
-from utils import logger
-from config import PROJECT_GIDS, PROJECT_NAMES, WORKSPACE_GID, MIGRATION_MODE
+from utils import logger, flush_logs
+from config import (
+    PROJECT_GIDS, PROJECT_NAMES, WORKSPACE_GID, MIGRATION_MODE, CONSOLE_LOG_LEVEL,
+    MAX_WORKERS, SORT_PROJECTS_BY_TASK_COUNT, COMPRESS_EXPORT_FILES
+)
+
+
+MONITOR_STATUS_URL = "http://localhost:8002/api/status"
+
+# One keep-alive session for all status updates, so each phase transition reuses the same
+# connection to the monitoring server instead of opening a new one
+_status_session = requests.Session()
+
+# Status updates are posted by one background worker, so a slow or unreachable monitoring server
+# never stalls the migration; a single worker keeps each project's phases in order
+_status_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='status-update')
+
+
+def _post_status_update(payload):
+    """Post a status update payload to the monitoring server (runs on the status worker)"""
+    try:
+        response = _status_session.post(MONITOR_STATUS_URL, json=payload, timeout=2)
+        logger.debug(f"Status update sent: {payload} - Response: {response.status_code}")
+    except requests.exceptions.RequestException as e:
+        # Silently fail if monitoring server is not available
+        logger.debug(f"Could not send status update to monitoring server: {e}")
 
 
 def send_status_update(project_gid, status, project_name=None):
     """
     Send migration status update to monitoring server
     
+    The update is posted in the background, so this returns without waiting for the server.
+    
     Args:
         project_gid: Asana project GID
         status: Phase status (Phase1, Phase2, Phase3)
         project_name: Asana project name (optional)
     """
-    try:
-        url = "http://localhost:8002/api/status"
-        payload = {
-            "asana GID": str(project_gid),
-            "status": status
-        }
-        if project_name:
-            payload["asana project name"] = project_name
-        response = requests.post(url, json=payload, timeout=2)
-        logger.debug(f"Status update sent: {payload} - Response: {response.status_code}")
-    except requests.exceptions.RequestException as e:
-        # Silently fail if monitoring server is not available
-        logger.debug(f"Could not send status update to monitoring server: {e}")
+    payload = {
+        "asana GID": str(project_gid),
+        "status": status
+    }
+    if project_name:
+        payload["asana project name"] = project_name
+    _status_executor.submit(_post_status_update, payload)
+
+
+def sort_projects_by_task_count(asana_client, project_gids):
+    """
+    Order project GIDs by task count, largest first
+    
+    Task counts are probed in parallel with one lightweight request per project.
+    
+    Args:
+        asana_client: Initialized Asana client
+        project_gids: List of Asana project GIDs
+    
+    Returns:
+        list: Project GIDs sorted by descending task count
+    """
+    logger.info(f"Probing task counts for {len(project_gids)} projects...")
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        counts = list(executor.map(asana_client.get_project_task_count, project_gids))
+    sizes = dict(zip(project_gids, counts))
+    
+    sorted_gids = sorted(project_gids, key=lambda gid: -sizes[gid])
+    for gid in sorted_gids:
+        logger.info(f"  {gid}: {sizes[gid]} tasks")
+    return sorted_gids
 
 
 def migrate_single_project(asana_client, scoro_client, project_gid=None, project_name=None, workspace_gid=None):
@@ -63,10 +110,6 @@ def migrate_single_project(asana_client, scoro_client, project_gid=None, project
         logger.info(f"PHASE 1: EXPORT FROM ASANA")
         logger.info(f"{'='*60}")
         
-        # Send status update for Phase 1 (with name if available)
-        if project_gid:
-            send_status_update(project_gid, "Phase1", project_name=project_name)
-        
         if project_gid:
             logger.info(f"\nExporting project from Asana using GID: {project_gid}...")
             logger.info(f"Using project GID: {project_gid}, workspace GID: {workspace_gid}")
@@ -101,10 +144,10 @@ def migrate_single_project(asana_client, scoro_client, project_gid=None, project
             logger.info(f"  Created: {proj.get('created_at', 'N/A')}")
             logger.info(f"  Modified: {proj.get('modified_at', 'N/A')}")
         
-        # Send Phase 1 status update if we now have the GID (migrating by name case)
-        if actual_project_gid and not project_gid:
+        # Send a single Phase 1 status update now that the export has resolved the GID and name
+        if actual_project_gid:
             send_status_update(actual_project_gid, "Phase1", project_name=actual_project_name)
-            print(f"Phase 1 status update sent: {actual_project_gid} - {actual_project_name}")
+            print(f"Phase 1 status update queued: {actual_project_gid} - {actual_project_name}")
         
         # Transform data
         logger.info(f"\n{'='*60}")
@@ -114,7 +157,7 @@ def migrate_single_project(asana_client, scoro_client, project_gid=None, project
         # Send status update for Phase 2
         if actual_project_gid:
             send_status_update(actual_project_gid, "Phase2", project_name=actual_project_name)
-            print(f"Phase 2 status update sent: {actual_project_gid} - {actual_project_name}")
+            print(f"Phase 2 status update queued: {actual_project_gid} - {actual_project_name}")
         
         logger.info("\nTransforming data...")
         transformed_data = transform_data(asana_data, summary)
@@ -147,8 +190,14 @@ def migrate_single_project(asana_client, scoro_client, project_gid=None, project
         logger.info("Saving exported data to file...")
         project_name_safe = proj.get('name', project_identifier).replace(' ', '_').replace('/', '_')
         output_file = f"asana_export_{project_name_safe}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(asana_data, f, indent=2, default=str)
+        if COMPRESS_EXPORT_FILES:
+            # Compact gzip-compressed JSON (decompress with: gunzip <file>.json.gz)
+            output_file += ".gz"
+            with gzip.open(output_file, 'wt', encoding='utf-8', compresslevel=6) as f:
+                json.dump(asana_data, f, separators=(',', ':'), default=str)
+        else:
+            with open(output_file, 'w', encoding='utf-8') as f:
+                json.dump(asana_data, f, indent=2, default=str)
         logger.info(f"✓ Exported data saved to: {output_file}")
         
         # Send completion status update
@@ -245,15 +294,22 @@ Examples:
         
         scoro_client = ScoroClient()
         
-        # Test Scoro connection by listing projects
+        # Test Scoro connection with a lightweight one-item request
         logger.info("Testing Scoro connection...")
         try:
-            scoro_projects = scoro_client.list_projects()
-            logger.info(f"✓ Connected to Scoro. Found {len(scoro_projects)} existing projects.")
-            if scoro_projects:
-                logger.info("  Sample projects:")
-                for proj in scoro_projects[:5]:  # Show first 5
-                    logger.info(f"    - {proj.get('name', 'Unknown')}")
+            if scoro_client.ping():
+                logger.info("✓ Connected to Scoro")
+            else:
+                logger.error("✗ Scoro connection test failed")
+            
+            # Listing projects pages through the whole account, so only do it for verbose console output
+            if CONSOLE_LOG_LEVEL <= logging.DEBUG:
+                scoro_projects = scoro_client.list_projects()
+                logger.debug(f"Found {len(scoro_projects)} existing Scoro projects.")
+                if scoro_projects:
+                    logger.debug("  Sample projects:")
+                    for proj in scoro_projects[:5]:  # Show first 5
+                        logger.debug(f"    - {proj.get('name', 'Unknown')}")
         except Exception as e:
             logger.error(f"✗ Error connecting to Scoro: {e}")
         
@@ -264,6 +320,16 @@ Examples:
             logger.info(f"MIGRATING {len(project_gids_to_migrate)} PROJECT(S) BY GID")
             logger.info(f"{'='*60}")
             
+            # Drop repeated GIDs (keeping the first occurrence) so no project is migrated twice in one run
+            unique_gids = list(dict.fromkeys(str(gid) for gid in project_gids_to_migrate))
+            if len(unique_gids) < len(project_gids_to_migrate):
+                logger.warning(f"Skipping {len(project_gids_to_migrate) - len(unique_gids)} duplicate project GID(s)")
+                project_gids_to_migrate = unique_gids
+            
+            # Start the largest projects first so they don't end up as stragglers at the end of the run
+            if SORT_PROJECTS_BY_TASK_COUNT and len(project_gids_to_migrate) > 1:
+                project_gids_to_migrate = sort_projects_by_task_count(asana_client, project_gids_to_migrate)
+            
             for idx, project_gid in enumerate(project_gids_to_migrate, 1):
                 logger.info(f"\n{'#'*60}")
                 logger.info(f"PROJECT {idx}/{len(project_gids_to_migrate)}: GID {project_gid}")
@@ -283,6 +349,9 @@ Examples:
                     logger.error(f"✗ Failed to migrate project: {result.get('project', project_gid)}")
                     if 'error' in result:
                         logger.error(f"  Error: {result['error']}")
+                
+                # Write this project's buffered log records to the log file
+                flush_logs()
         
         elif MIGRATION_MODE == 'names' and PROJECT_NAMES:
             # Migrate by names (only if no CLI args and names mode is set)
@@ -309,6 +378,9 @@ Examples:
                     logger.error(f"✗ Failed to migrate project: {result.get('project', project_name)}")
                     if 'error' in result:
                         logger.error(f"  Error: {result['error']}")
+                
+                # Write this project's buffered log records to the log file
+                flush_logs()
         else:
             logger.error("No project GIDs provided via command line and none configured in config.py")
             logger.error("Usage: python main.py <project_gid1> [project_gid2] ...")
@@ -334,12 +406,20 @@ Examples:
         logger.info("OVERALL MIGRATION SUMMARY")
         logger.info(f"{'='*60}")
         
-        successful_migrations = sum(1 for r in all_results if r['success'])
+        # Aggregate project outcomes and per-item counters in a single pass over the results
+        successful_migrations = 0
+        items_succeeded = 0
+        items_failed = 0
+        for r in all_results:
+            successful_migrations += r['success']
+            items_succeeded += r['summary'].succeeded
+            items_failed += r['summary'].failed
         failed_migrations = len(all_results) - successful_migrations
         
         logger.info(f"Total projects: {len(all_results)}")
         logger.info(f"  ✓ Successful: {successful_migrations}")
         logger.info(f"  ✗ Failed: {failed_migrations}")
+        logger.info(f"Total items: {items_succeeded + items_failed} ({items_succeeded} succeeded, {items_failed} failed)")
         
         if all_results:
             logger.info("\nProject Details:")
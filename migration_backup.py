@@ -2,21 +2,311 @@
 Script to list tasks that would be deleted for backup project IDs in config.py
 This script does NOT delete anything - it only lists the tasks for verification.
 """
+import argparse
+import json
+import os
 import sys
-from typing import List, Dict
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional
+import requests
 
 from clients.scoro_client import ScoroClient
-from config import Backup_Scoro_Project_ID
+from config import (
+    Backup_Scoro_Project_ID, MAX_WORKERS, BACKUP_PROJECT_CACHE_FILE, BACKUP_PROJECT_CACHE_TTL,
+    BACKUP_TASK_DISPLAY_LIMIT, ENV_BACKUP_TASK_DISPLAY_LIMIT
+)
 from utils import logger
 
+# Task fields read when listing backup project tasks
+BACKUP_TASK_FIELDS = [
+    'event_id', 'event_name', 'status', 'status_name',
+    'project_id', 'is_completed', 'datetime_completed',
+]
 
-def list_backup_project_tasks(scoro_client: ScoroClient, project_id: int) -> List[Dict]:
+
+# Project details fetched during this run, keyed by project ID
+_backup_projects: Dict[int, Optional[Dict]] = {}
+
+
+def get_backup_project(scoro_client: ScoroClient, project_id: int) -> Optional[Dict]:
+    """
+    Get project details for a backup project, cached per project ID for this run
+    
+    Args:
+        scoro_client: Scoro client instance
+        project_id: Project ID to fetch
+    
+    Returns:
+        Project dictionary or None if not found
+    """
+    if project_id not in _backup_projects:
+        _backup_projects[project_id] = scoro_client.get_project(project_id)
+    return _backup_projects[project_id]
+
+
+def load_project_cache_file() -> Dict[str, Dict]:
+    """
+    Load cached project details from BACKUP_PROJECT_CACHE_FILE
+    
+    Returns:
+        Dictionary mapping project ID (as string) to {'fetched_at': timestamp, 'project': dict}
+    """
+    if not os.path.exists(BACKUP_PROJECT_CACHE_FILE):
+        return {}
+    try:
+        with open(BACKUP_PROJECT_CACHE_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        logger.warning(f"Could not read project cache {BACKUP_PROJECT_CACHE_FILE}: {e}")
+        return {}
+
+
+def save_project_cache_file(cache: Dict[str, Dict]) -> None:
+    """
+    Save cached project details to BACKUP_PROJECT_CACHE_FILE
+    
+    Args:
+        cache: Dictionary mapping project ID (as string) to {'fetched_at': timestamp, 'project': dict}
+    """
+    try:
+        with open(BACKUP_PROJECT_CACHE_FILE, 'w', encoding='utf-8') as f:
+            json.dump(cache, f, ensure_ascii=False)
+    except OSError as e:
+        logger.warning(f"Could not write project cache {BACKUP_PROJECT_CACHE_FILE}: {e}")
+
+
+def preload_backup_projects(scoro_client: ScoroClient, project_ids: List[int], use_cache: bool = True) -> None:
+    """
+    Fill the project details cache, reading fresh entries from the on-disk cache
+    and fetching the rest with one batched request (any projects the batch did
+    not return are fetched individually in parallel)
+    
+    Args:
+        scoro_client: Scoro client instance
+        project_ids: Project IDs to fetch
+        use_cache: Whether to read and update the on-disk project cache
+    """
+    cache = load_project_cache_file() if use_cache else {}
+    now = time.time()
+    for project_id in project_ids:
+        entry = cache.get(str(project_id))
+        if entry and now - entry.get('fetched_at', 0) < BACKUP_PROJECT_CACHE_TTL:
+            _backup_projects[project_id] = entry.get('project')
+    
+    to_fetch = [project_id for project_id in project_ids if project_id not in _backup_projects]
+    if not to_fetch:
+        logger.info(f"Loaded {len(project_ids)} project(s) from {BACKUP_PROJECT_CACHE_FILE}")
+        return
+    
+    _backup_projects.update(scoro_client.get_projects(to_fetch))
+    missing = [project_id for project_id in to_fetch if project_id not in _backup_projects]
+    if missing:
+        logger.debug(f"Fetching {len(missing)} project(s) individually")
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            list(executor.map(lambda project_id: get_backup_project(scoro_client, project_id), missing))
+    
+    if use_cache:
+        for project_id in to_fetch:
+            # Projects that were not found are not cached, so they are looked up again next run
+            if _backup_projects.get(project_id):
+                cache[str(project_id)] = {'fetched_at': now, 'project': _backup_projects[project_id]}
+        save_project_cache_file(cache)
+
+
+def is_backup_project_task(task: Dict, project_id: int) -> bool:
+    """
+    Check that a task belongs to the given project and has an ID
+    
+    Args:
+        task: Task dictionary from Scoro
+        project_id: Project ID the task is expected to belong to
+    
+    Returns:
+        True if the task should be listed for the project
+    """
+    task_project_id = task.get('project_id')
+    task_id = task.get('event_id') or task.get('id') or task.get('task_id')
+    
+    if task_project_id != project_id:
+        logger.debug(f"Task {task_id} has project_id {task_project_id}, expected {project_id} - skipping")
+        return False
+    
+    if not task_id:
+        task_name = task.get('event_name') or task.get('name', 'Unknown')
+        logger.warning(f"Task has no ID, skipping: {task_name}")
+        return False
+    
+    return True
+
+
+def collect_backup_project_tasks(tasks: Iterable[Dict], project_id: int) -> List[Dict]:
+    """
+    Keep the valid tasks of a project from a task listing
+    
+    Tasks of other projects are only counted and reported in one line per project,
+    so a listing whose project_id filter is ignored doesn't log every task in Scoro.
+    
+    Args:
+        tasks: Tasks listed for the project (e.g. from ScoroClient.iter_tasks)
+        project_id: Project ID the tasks are expected to belong to
+    
+    Returns:
+        List of task dictionaries that belong to the project
+    """
+    project_tasks = []
+    skipped_count = 0
+    
+    for task in tasks:
+        if is_backup_project_task(task, project_id):
+            project_tasks.append(task)
+        elif task.get('project_id') != project_id:
+            skipped_count += 1
+    
+    if skipped_count:
+        logger.warning(f"Skipped {skipped_count} tasks from other projects while listing project {project_id}")
+    
+    return project_tasks
+
+
+def get_task_display_limit() -> int:
+    """
+    Get how many tasks to list in detail per project
+    
+    Returns:
+        BACKUP_TASK_DISPLAY_LIMIT env var if set to a valid integer, else the config default
+    """
+    value = os.getenv(ENV_BACKUP_TASK_DISPLAY_LIMIT)
+    if value:
+        try:
+            return int(value)
+        except ValueError:
+            logger.warning(f"Invalid {ENV_BACKUP_TASK_DISPLAY_LIMIT} value '{value}', using {BACKUP_TASK_DISPLAY_LIMIT}")
+    return BACKUP_TASK_DISPLAY_LIMIT
+
+
+def format_task_list(tasks: List[Dict], limit: Optional[int] = None) -> str:
+    """
+    Format tasks for display as a single log message
+    
+    Args:
+        tasks: Non-empty list of task dictionaries
+        limit: Optional number of tasks to list in detail; the rest are only counted
+    
+    Returns:
+        Multi-line string with one block per listed task
+    """
+    shown_tasks = tasks if limit is None else tasks[:limit]
+    lines = []
+    for idx, task in enumerate(shown_tasks, 1):
+        task_id = task.get('event_id') or task.get('id') or task.get('task_id')
+        task_name = task.get('event_name') or task.get('name', 'Unknown')
+        task_status = task.get('status', 'N/A')
+        task_status_name = task.get('status_name', 'N/A')
+        task_project_id = task.get('project_id')
+        is_completed = task.get('is_completed', False)
+        completed_date = task.get('datetime_completed', 'N/A')
+        
+        lines.append(f"{idx}. Task ID: {task_id}")
+        lines.append(f"   Name: {task_name}")
+        lines.append(f"   Status: {task_status} ({task_status_name})")
+        lines.append(f"   Project ID: {task_project_id}")
+        lines.append(f"   Completed: {is_completed}")
+        if completed_date and completed_date != 'N/A':
+            lines.append(f"   Completed Date: {completed_date}")
+        lines.append("")
+    
+    if len(tasks) > len(shown_tasks):
+        lines.append(f"... and {len(tasks) - len(shown_tasks):,} more tasks omitted")
+    return "\n".join(lines)
+
+
+def fetch_tasks_combined(scoro_client: ScoroClient, tasks_by_project: Dict[int, List[Dict]]) -> bool:
+    """
+    Try to fetch the tasks of several projects in one listing with a list-valued project_id filter
+    
+    Scoro's API reference doesn't document list values for the project_id filter, and some list
+    endpoints ignore their filters (see docs/BUG_FIX_PROJECT_ASSIGNMENT.md). iter_tasks also yields
+    nothing when the first request fails and raises when a later page fails, so the listing is only
+    trusted if it completed, returned tasks and every task belongs to one of the requested projects.
+    
+    Args:
+        scoro_client: Scoro client instance
+        tasks_by_project: One empty list per requested project_id, filled with its valid tasks
+    
+    Returns:
+        True if the combined listing could be used, False if the projects must be listed one by one
+    """
+    fetched_count = 0
+    try:
+        for task in scoro_client.iter_tasks(filters={"project_id": list(tasks_by_project)}, fields=BACKUP_TASK_FIELDS):
+            fetched_count += 1
+            task_project_id = task.get('project_id')
+            bucket = tasks_by_project.get(task_project_id)
+            if bucket is None:
+                logger.warning(f"Combined task listing returned a task of project {task_project_id}, "
+                               f"which was not requested - the project_id list filter is not applied")
+                return False
+            if is_backup_project_task(task, task_project_id):
+                bucket.append(task)
+    except requests.exceptions.RequestException as e:
+        # The earlier pages were already indexed, but a partial listing must not be shown as complete
+        logger.warning(f"Combined task listing failed after {fetched_count} tasks: {e}")
+        return False
+    
+    if not fetched_count:
+        logger.warning("Combined task listing returned no tasks - the project_id list filter may be unsupported")
+        return False
+    
+    logger.info(f"Fetched {fetched_count} tasks from Scoro")
+    return True
+
+
+def group_tasks_by_project(scoro_client: ScoroClient, project_ids: List[int]) -> Dict[int, List[Dict]]:
+    """
+    Fetch tasks for the backup projects and index them by project_id
+    
+    Several projects are first fetched in a single listing; if that listing can't be
+    trusted (see fetch_tasks_combined), each project is listed on its own instead.
+    Tasks are validated while indexing, so each project's task list can afterwards
+    be looked up directly without another pass over the tasks.
+    
+    Args:
+        scoro_client: Scoro client instance
+        project_ids: Project IDs to fetch tasks for
+    
+    Returns:
+        Dictionary mapping project_id to its list of valid tasks
+    """
+    # Pre-seed one bucket per requested project so each task costs a single dict lookup
+    tasks_by_project = {project_id: [] for project_id in project_ids}
+    
+    if len(tasks_by_project) > 1:
+        logger.info(f"Fetching tasks for {len(tasks_by_project)} backup project(s) in a single listing...")
+        if fetch_tasks_combined(scoro_client, tasks_by_project):
+            return tasks_by_project
+        logger.warning("Falling back to listing the tasks of each backup project separately")
+        tasks_by_project = {project_id: [] for project_id in project_ids}
+    
+    # Stream each project's pages and keep only its valid tasks
+    for project_id in tasks_by_project:
+        logger.info(f"Fetching tasks for project {project_id}...")
+        tasks_by_project[project_id] = collect_backup_project_tasks(
+            scoro_client.iter_tasks(project_id=project_id, fields=BACKUP_TASK_FIELDS), project_id
+        )
+    
+    return tasks_by_project
+
+
+def list_backup_project_tasks(scoro_client: ScoroClient, project_id: int,
+                              tasks_by_project: Optional[Dict[int, List[Dict]]] = None) -> List[Dict]:
     """
     List all tasks that belong to a given backup project ID (without deleting)
     
     Args:
         scoro_client: Scoro client instance
         project_id: Project ID to list tasks for
+        tasks_by_project: Optional tasks indexed by project_id from group_tasks_by_project (skips the fetch)
     
     Returns:
         List of task dictionaries that belong to the project
@@ -26,7 +316,7 @@ def list_backup_project_tasks(scoro_client: ScoroClient, project_id: int) -> Lis
         
         # Step 0: Get project details to verify
         logger.info(f"Fetching project details for verification...")
-        project = scoro_client.get_project(project_id)
+        project = get_backup_project(scoro_client, project_id)
         
         if not project:
             logger.error(f"Project {project_id} not found in Scoro.")
@@ -45,34 +335,18 @@ def list_backup_project_tasks(scoro_client: ScoroClient, project_id: int) -> Lis
         logger.info(f"Company: {project_company}")
         logger.info(f"{'='*60}\n")
         
-        # Step 1: List all tasks (fetch all and filter client-side for safety)
-        logger.info(f"Fetching all tasks (will filter for project {project_id} client-side)...")
-        all_tasks = scoro_client.list_tasks()  # Fetch all tasks without filter
-        logger.info(f"Fetched {len(all_tasks)} total tasks from Scoro")
-        
-        # Filter tasks that belong to this project
-        filtered_tasks = []
-        skipped_count = 0
-        
-        for task in all_tasks:
-            task_project_id = task.get('project_id')
-            task_id = task.get('event_id') or task.get('id') or task.get('task_id')
-            task_name = task.get('event_name') or task.get('name', 'Unknown')
-            
-            # Verify the task belongs to the project
-            if task_project_id != project_id:
-                skipped_count += 1
-                continue
-            
-            if not task_id:
-                logger.warning(f"Task has no ID, skipping: {task_name}")
-                skipped_count += 1
-                continue
-            
-            filtered_tasks.append(task)
+        # Step 1: Get tasks for this project (indexed up front, or streamed and filtered server-side by project_id)
+        if tasks_by_project is not None:
+            filtered_tasks = tasks_by_project.get(project_id, [])
+        else:
+            logger.info(f"Fetching tasks for project {project_id}...")
+            # Verify each task belongs to the project (safety check on the server-side filter),
+            # filtering as tasks arrive so only matching ones are kept in memory
+            filtered_tasks = collect_backup_project_tasks(
+                scoro_client.iter_tasks(project_id=project_id, fields=BACKUP_TASK_FIELDS), project_id
+            )
         
         logger.info(f"Found {len(filtered_tasks)} tasks belonging to project {project_id}")
-        logger.info(f"Skipped {skipped_count} tasks from other projects")
         
         return filtered_tasks
             
@@ -87,6 +361,16 @@ def main():
     """
     Main function to list tasks that would be deleted (NO DELETION - READ ONLY)
     """
+    parser = argparse.ArgumentParser(
+        description='List tasks that would be deleted for the backup project IDs in config.py (read-only)'
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help=f'Fetch project details from Scoro instead of using {BACKUP_PROJECT_CACHE_FILE}'
+    )
+    args = parser.parse_args()
+    
     try:
         # Get backup project IDs from config
         if not Backup_Scoro_Project_ID:
@@ -100,8 +384,20 @@ def main():
         logger.info("Initializing Scoro client...")
         scoro_client = ScoroClient()
         
+        # Fetch the backup projects' tasks once and index them by project_id,
+        # so each project below is answered with a dict lookup
+        tasks_by_project = None
+        try:
+            project_ids = [int(project_id_str) for project_id_str in Backup_Scoro_Project_ID]
+            # Load all project details up front; the loop below reads them from the cache
+            preload_backup_projects(scoro_client, project_ids, use_cache=not args.no_cache)
+            tasks_by_project = group_tasks_by_project(scoro_client, project_ids)
+        except ValueError:
+            logger.warning("Invalid project ID in Backup_Scoro_Project_ID, fetching tasks per project")
+        
         # Process each backup project ID
         all_tasks_to_delete = []
+        display_limit = get_task_display_limit()
         
         for project_id_str in Backup_Scoro_Project_ID:
             try:
@@ -112,11 +408,11 @@ def main():
                 logger.info(f"{'='*60}")
                 
                 # Get project name for summary
-                project = scoro_client.get_project(project_id)
+                project = get_backup_project(scoro_client, project_id)
                 project_name = project.get('project_name') or project.get('name', 'Unknown') if project else 'Unknown'
                 
                 # List tasks for this project
-                tasks = list_backup_project_tasks(scoro_client, project_id)
+                tasks = list_backup_project_tasks(scoro_client, project_id, tasks_by_project)
                 
                 if tasks:
                     logger.info(f"\n{'='*60}")
@@ -124,24 +420,8 @@ def main():
                     logger.info(f"{'='*60}")
                     logger.info(f"Total tasks: {len(tasks)}\n")
                     
-                    # Display task list
-                    for idx, task in enumerate(tasks, 1):
-                        task_id = task.get('event_id') or task.get('id') or task.get('task_id')
-                        task_name = task.get('event_name') or task.get('name', 'Unknown')
-                        task_status = task.get('status', 'N/A')
-                        task_status_name = task.get('status_name', 'N/A')
-                        task_project_id = task.get('project_id')
-                        is_completed = task.get('is_completed', False)
-                        completed_date = task.get('datetime_completed', 'N/A')
-                        
-                        logger.info(f"{idx}. Task ID: {task_id}")
-                        logger.info(f"   Name: {task_name}")
-                        logger.info(f"   Status: {task_status} ({task_status_name})")
-                        logger.info(f"   Project ID: {task_project_id}")
-                        logger.info(f"   Completed: {is_completed}")
-                        if completed_date and completed_date != 'N/A':
-                            logger.info(f"   Completed Date: {completed_date}")
-                        logger.info("")
+                    # Display task list (built up and written as a single log record)
+                    logger.info(format_task_list(tasks, display_limit))
                     
                     # Store for summary
                     all_tasks_to_delete.extend(tasks)
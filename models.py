@@ -1,8 +1,10 @@
 """
 Data models for migration tracking
 """
-from dataclasses import dataclass
-from typing import List
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Deque
+from config import MAX_SUMMARY_ERRORS
 from utils import logger
 
 
@@ -12,11 +14,7 @@ class MigrationSummary:
     total_items: int = 0
     succeeded: int = 0
     failed: int = 0
-    errors: List[str] = None
-    
-    def __post_init__(self):
-        if self.errors is None:
-            self.errors = []
+    errors: Deque[str] = field(default_factory=lambda: deque(maxlen=MAX_SUMMARY_ERRORS))  # Most recent errors only
     
     def add_success(self):
         self.total_items += 1
@@ -36,8 +34,11 @@ class MigrationSummary:
         logger.info(f"Succeeded: {self.succeeded}")
         logger.info(f"Failed: {self.failed}")
         if self.errors:
-            logger.info(f"\nErrors ({len(self.errors)}):")
-            for i, error in enumerate(self.errors, 1):
+            if self.failed > len(self.errors):
+                logger.info(f"\nErrors ({self.failed}, showing last {len(self.errors)}):")
+            else:
+                logger.info(f"\nErrors ({len(self.errors)}):")
+            for i, error in enumerate(self.errors, self.failed - len(self.errors) + 1):
                 logger.info(f"  {i}. {error}")
         logger.info("="*60 + "\n")
 
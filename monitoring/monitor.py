@@ -3,89 +3,168 @@
 Migration Monitoring System
 Receives status updates from migration scripts and displays them in a web dashboard
 """
+import atexit
 import csv
+import gzip
+import hashlib
+import io
 import os
+import queue
+import sys
+import time
+from collections import Counter, deque
 from datetime import datetime
-from flask import Flask, request, jsonify, render_template_string
+from itertools import islice
+from operator import itemgetter
+from flask import Flask, request, jsonify
 from flask_cors import CORS
 import threading
 import json
 
+try:
+    import orjson
+except ImportError:
+    # orjson not available, responses are encoded with Flask's jsonify
+    orjson = None
+
+try:
+    from waitress import serve
+except ImportError:
+    # waitress not available, will fall back to Flask's development server
+    serve = None
+
 app = Flask(__name__)
 CORS(app)  # Enable CORS for all routes
 
+# Number of request threads when served by waitress (each open dashboard holds one for its event stream)
+SERVER_THREADS = 16
+# At most this many /api/events streams are open at once, so the rest of the threads stay free for
+# POST /api/status; further dashboards get 503 and poll /api/projects instead
+MAX_EVENT_STREAMS = SERVER_THREADS // 2
+
+# Responses smaller than this (bytes) are sent uncompressed
+COMPRESS_MIN_SIZE = 512
+
+# Export row fields of a project_status entry, and rows per streamed chunk
+EXPORT_ROW = itemgetter('gid', 'project_name', 'status', 'timestamp')
+EXPORT_CHUNK_ROWS = 500
+
 # CSV file path
 CSV_FILE = os.path.join(os.path.dirname(__file__), 'migration_status.csv')
+CSV_HEADER = ['Timestamp', 'Asana GID', 'Project Name', 'Status']
+CSV_IO_BUFFER = 1 << 16  # File buffer (bytes), so loads and rewrites go through a few large reads/writes
 
 # In-memory storage for real-time updates (project GID -> latest status)
 project_status = {}
 
+# Number of projects in each status, kept in step with project_status
+status_counts = Counter()
+
+# Lock for thread-safe project_status/status_counts updates
+status_lock = threading.Lock()
+
+# Notified (under status_lock) whenever project_status changes, to wake /api/events streams
+state_changed = threading.Condition(status_lock)
+SSE_KEEPALIVE = 15  # Seconds between keep-alive comments on an idle event stream
+
+# Number of open /api/events streams, limited to MAX_EVENT_STREAMS
+active_event_streams = 0
+event_streams_lock = threading.Lock()
+
+# Version of project_status, bumped on every change. It starts at the startup time in ms,
+# so a version a dashboard got from a previous server run is never taken for a current one
+state_version = int(time.time() * 1000)
+
+# Recent (version, gid) changes, so dashboards can fetch only the projects changed since their last poll
+CHANGE_LOG_SIZE = 1000
+change_log = deque(maxlen=CHANGE_LOG_SIZE)
+
 # Lock for thread-safe CSV writing
 csv_lock = threading.Lock()
 
+# Status updates waiting to be written to the CSV, drained in batches by the csv-writer thread
+csv_queue = queue.Queue()
+CSV_BATCH_DELAY = 0.2  # Seconds to wait for more updates before writing a batch
+CSV_BATCH_SIZE = 100  # Maximum updates written in one batch
+CSV_FLUSH_TIMEOUT = 5  # Seconds to wait at exit for queued updates to reach the CSV
+
+# Updates are appended to the CSV; it is rewritten with one row per GID (compacted) once it
+# holds more than CSV_COMPACT_RATIO rows per project and at least CSV_COMPACT_MIN_ROWS rows
+CSV_COMPACT_RATIO = 4
+CSV_COMPACT_MIN_ROWS = 1000
+
+# Parsed CSV contents (header, GID -> latest row, and the number of data rows in the file),
+# valid while the file's mtime matches
+_csv_cache = {'mtime': None, 'header': None, 'rows': {}, 'file_rows': 0}
+
+# Last encoded full snapshot as (version, JSON bytes, gzipped JSON bytes); replaced as a whole
+_snapshot_cache = None
+
+
+def json_bytes(obj):
+    """Encode an object as UTF-8 JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
+
+def ojsonify(obj):
+    """Build a JSON response, encoded with orjson when it is installed"""
+    if orjson is not None:
+        return app.response_class(orjson.dumps(obj), mimetype='application/json')
+    return jsonify(obj)
+
 
 def ensure_csv_header():
     """Ensure CSV file has proper headers"""
     if not os.path.exists(CSV_FILE):
         with open(CSV_FILE, 'w', newline='', encoding='utf-8') as f:
             writer = csv.writer(f)
-            writer.writerow(['Timestamp', 'Asana GID', 'Project Name', 'Status'])
+            writer.writerow(CSV_HEADER)
 
 
 def load_from_csv():
     """Load latest status for each project from CSV file"""
-    if not os.path.exists(CSV_FILE):
-        return
-    
+    global state_version
     try:
-        # Dictionary to track latest entry for each GID
+        # Parse the CSV through the row cache, so the first status update after startup
+        # reuses this parse instead of reading the file again. Its stat also covers a missing file
+        with csv_lock:
+            header, rows = _load_csv_rows()
+        if header is None:
+            return
+        
+        # Latest entry for each GID (the row cache keeps one row per GID), built in the
+        # project_status format directly
         latest_entries = {}
         
-        with open(CSV_FILE, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                gid = row.get('Asana GID', '').strip()
-                project_name = row.get('Project Name', 'Unknown Project').strip()
-                status = row.get('Status', '').strip()
-                timestamp_str = row.get('Timestamp', '').strip()
+        for row in rows.values():
+            if len(row) < 4:
+                continue
+            timestamp_str, gid, project_name, status = (value.strip() for value in row[:4])
+            
+            if gid and status:
+                # Parse timestamp ('%Y-%m-%d %H:%M:%S'); fromisoformat is a C fast path, unlike strptime
+                try:
+                    timestamp = datetime.fromisoformat(timestamp_str).isoformat()
+                except ValueError:
+                    timestamp = datetime.now().isoformat()
                 
-                if gid and status:
-                    # Parse timestamp
-                    try:
-                        dt = datetime.strptime(timestamp_str, '%Y-%m-%d %H:%M:%S')
-                        timestamp = dt.isoformat()
-                    except:
-                        dt = datetime.now()
-                        timestamp = dt.isoformat()
-                    
-                    # Keep track of latest entry for each GID
-                    if gid not in latest_entries:
-                        latest_entries[gid] = {
-                            'gid': gid,
-                            'project_name': project_name,
-                            'status': status,
-                            'timestamp': timestamp,
-                            'datetime': dt
-                        }
-                    else:
-                        # Compare timestamps and keep the latest
-                        if dt > latest_entries[gid]['datetime']:
-                            latest_entries[gid] = {
-                                'gid': gid,
-                                'project_name': project_name,
-                                'status': status,
-                                'timestamp': timestamp,
-                                'datetime': dt
-                            }
-        
-        # Convert to project_status format (remove datetime field)
-        for gid, entry in latest_entries.items():
-            project_status[gid] = {
-                'gid': entry['gid'],
-                'project_name': entry['project_name'],
-                'status': entry['status'],
-                'timestamp': entry['timestamp']
-            }
+                latest_entries[gid] = {
+                    'gid': gid,
+                    'project_name': project_name,
+                    'status': status,
+                    'timestamp': timestamp
+                }
+        
+        with status_lock:
+            project_status.update(latest_entries)
+            status_counts.clear()
+            status_counts.update(entry['status'] for entry in project_status.values())
+            # Bulk reload: force dashboards to fetch a full snapshot
+            state_version += 1
+            change_log.clear()
+            state_changed.notify_all()
         
         print(f"✓ Loaded {len(project_status)} projects from CSV")
     except Exception as e:
@@ -94,51 +173,213 @@ def load_from_csv():
         traceback.print_exc()
 
 
-def save_to_csv(gid, project_name, status):
-    """Save status update to CSV file - updates existing row if GID exists, otherwise adds new row"""
-    with csv_lock:
-        ensure_csv_header()
+def _load_csv_rows():
+    """
+    Return the CSV header and data rows keyed by GID, re-parsing the file only
+    when it changed on disk since it was last read or written here
+    """
+    try:
+        mtime = os.stat(CSV_FILE).st_mtime_ns
+    except FileNotFoundError:
+        # No file (yet): start from an empty table that the next batch write creates
+        _csv_cache.update(mtime=None, header=None, rows={}, file_rows=0)
+        return _csv_cache['header'], _csv_cache['rows']
+    if _csv_cache['mtime'] != mtime:
+        rows = {}
+        file_rows = 0
+        with open(CSV_FILE, 'r', newline='', encoding='utf-8', buffering=CSV_IO_BUFFER) as f:
+            reader = csv.reader(f)
+            header = next(reader, None)  # Read header
+            for row in reader:
+                file_rows += 1
+                if len(row) >= 2:
+                    # Keep the latest row for each GID ('%Y-%m-%d %H:%M:%S' timestamps sort as strings)
+                    existing = rows.get(row[1])
+                    if existing is None or row[0] >= existing[0]:
+                        rows.pop(row[1], None)
+                        rows[row[1]] = row
+        _csv_cache['mtime'] = mtime
+        _csv_cache['header'] = header
+        _csv_cache['rows'] = rows
+        _csv_cache['file_rows'] = file_rows
+    return _csv_cache['header'], _csv_cache['rows']
+
+
+def save_to_csv(gid, project_name, status, timestamp=None):
+    """
+    Queue a status update for the CSV writer thread, so the request never waits on file I/O
+    
+    Args:
+        timestamp: CSV timestamp ('%Y-%m-%d %H:%M:%S'); defaults to now
+    """
+    if timestamp is None:
         timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    csv_queue.put((timestamp, gid, project_name, status))
+
+
+def write_csv_updates(updates):
+    """
+    Save a batch of status updates to CSV file
+    
+    New rows are appended; readers keep the latest row per GID. The file is compacted
+    (rewritten with one row per GID) once it grows past the CSV_COMPACT_* thresholds.
+    """
+    with csv_lock:
+        # Existing rows come from the parsed-CSV cache instead of re-reading the file on every update
+        header, rows = _load_csv_rows()
         
-        # Read all existing rows
-        rows = []
-        gid_found = False
+        # Coalesce the batch to the last update per GID, so a project updated several times
+        # within one batch costs a single row
+        latest = {}
+        for timestamp, gid, project_name, status in updates:
+            latest.pop(str(gid), None)
+            latest[str(gid)] = [timestamp, gid, project_name, status]
+        new_rows = list(latest.values())
         
-        if os.path.exists(CSV_FILE):
-            with open(CSV_FILE, 'r', encoding='utf-8') as f:
-                reader = csv.reader(f)
-                header = next(reader, None)  # Read header
-                if header:
-                    rows.append(header)
-                
-                # Read all data rows, skip any duplicates of the same GID
-                for row in reader:
-                    if len(row) >= 2 and row[1] == str(gid):  # Check if GID matches (column index 1)
-                        # Skip old row with same GID (we'll add updated one)
-                        gid_found = True
-                        continue
-                    else:
-                        # Keep existing row (different GID)
-                        rows.append(row)
-        
-        # Add/update row for this GID
-        rows.append([timestamp, gid, project_name, status])
-        
-        # Write all rows back to file
-        with open(CSV_FILE, 'w', newline='', encoding='utf-8') as f:
+        # Add/update row for each GID (moved to the end, as the latest update)
+        for row in new_rows:
+            rows.pop(str(row[1]), None)
+            rows[str(row[1])] = row
+        
+        file_rows = _csv_cache['file_rows'] + len(new_rows)
+        # A missing or headerless file is written from scratch, header included
+        compact = header is None or file_rows > max(CSV_COMPACT_MIN_ROWS, CSV_COMPACT_RATIO * len(rows))
+        if compact:
+            # Compaction writes a temporary file and swaps it in atomically, so a crash
+            # mid-rewrite never leaves a truncated CSV behind
+            path, mode, out_rows, file_rows = CSV_FILE + '.tmp', 'w', rows.values(), len(rows)
+        else:
+            path, mode, out_rows = CSV_FILE, 'a', new_rows
+        
+        with open(path, mode, newline='', encoding='utf-8', buffering=CSV_IO_BUFFER) as f:
             writer = csv.writer(f)
-            writer.writerows(rows)
+            if compact:
+                _csv_cache['header'] = header = header or CSV_HEADER
+                writer.writerow(header)
+            writer.writerows(out_rows)
+            f.flush()
+            if compact:
+                os.fsync(f.fileno())
+            # Last write is done, so the open handle already has the final mtime (no path lookup)
+            _csv_cache['mtime'] = os.fstat(f.fileno()).st_mtime_ns
+        if compact:
+            os.replace(path, CSV_FILE)
+        _csv_cache['file_rows'] = file_rows
+
+
+def csv_writer_loop():
+    """Background thread: collect queued status updates, log them and write them to the CSV in batches"""
+    while True:
+        updates = [csv_queue.get()]
+        # Give a burst of updates a moment to arrive so it is written in one pass
+        time.sleep(CSV_BATCH_DELAY)
+        try:
+            while len(updates) < CSV_BATCH_SIZE:
+                updates.append(csv_queue.get_nowait())
+        except queue.Empty:
+            pass
+        
+        try:
+            # Console lines for the whole batch in one write, so request threads never block on stdout.
+            # A console that can't take them (encoding error, closed pipe) must not stop the CSV write
+            tracked = len(project_status)
+            try:
+                sys.stdout.write(''.join(
+                    f"✓ Status update received: {gid} ({project_name}) - {status} [{tracked} projects]\n"
+                    for _, gid, project_name, status in updates
+                ))
+                sys.stdout.flush()
+            except (OSError, ValueError):  # UnicodeEncodeError is a ValueError
+                pass
+            
+            write_csv_updates(updates)
+        except Exception as e:
+            try:
+                print(f"✗ Error writing status updates to CSV: {e}")
+            except (OSError, ValueError):
+                pass
+        finally:
+            for _ in updates:
+                csv_queue.task_done()
+
+
+def flush_csv_queue():
+    """At exit: wait up to CSV_FLUSH_TIMEOUT seconds for queued updates to be written, while the writer runs"""
+    deadline = time.monotonic() + CSV_FLUSH_TIMEOUT
+    with csv_queue.all_tasks_done:
+        while csv_queue.unfinished_tasks and csv_writer_thread.is_alive():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            csv_queue.all_tasks_done.wait(remaining)
+
+
+# Start the CSV writer thread
+csv_writer_thread = threading.Thread(target=csv_writer_loop, name='csv-writer', daemon=True)
+csv_writer_thread.start()
+# Wait for queued updates to reach the file before the process exits
+atexit.register(flush_csv_queue)
+
+
+@app.after_request
+def compress_response(response):
+    """Gzip-compress larger responses (project changes, debug output) for clients that accept it"""
+    if (response.status_code != 200 or response.direct_passthrough or response.is_streamed
+            or 'Content-Encoding' in response.headers
+            or 'gzip' not in request.headers.get('Accept-Encoding', '')):
+        return response
+    
+    data = response.get_data()
+    if len(data) < COMPRESS_MIN_SIZE:
+        return response
+    
+    response.set_data(gzip.compress(data, compresslevel=6))
+    response.headers['Content-Encoding'] = 'gzip'
+    response.vary.add('Accept-Encoding')
+    return response
+
+
+def send_precompressed(response, gzip_body):
+    """
+    Send a gzip body compressed ahead of time in place of the plain one, for 200 responses
+    to clients that accept gzip. compress_response then skips the already-encoded response.
+    """
+    if (response.status_code == 200 and len(response.get_data()) >= COMPRESS_MIN_SIZE
+            and 'gzip' in request.headers.get('Accept-Encoding', '')):
+        response.set_data(gzip_body)
+        response.headers['Content-Encoding'] = 'gzip'
+        response.vary.add('Accept-Encoding')
+    return response
 
 
 @app.route('/', methods=['GET'])
 def dashboard():
     """Serve the monitoring dashboard"""
-    return render_template_string(DASHBOARD_HTML)
+    # The page is static (no template variables), so it is served as-is with an ETag;
+    # browsers revalidate it and get a 304 instead of the full page
+    response = app.response_class(DASHBOARD_HTML_BYTES, mimetype='text/html')
+    # Weak ETag: the plain and gzip-encoded page share it (If-None-Match uses weak comparison)
+    response.set_etag(DASHBOARD_ETAG, weak=True)
+    response.cache_control.public = True
+    response.cache_control.max_age = 60
+    return send_precompressed(response.make_conditional(request), DASHBOARD_HTML_GZIP)
+
+
+def parse_json_body():
+    """Parse the request body as JSON regardless of Content-Type; None if it is not valid JSON"""
+    if orjson is None:
+        return request.get_json(force=True, silent=True)
+    # Parse the raw body bytes directly; orjson needs no separate decode to str
+    try:
+        return orjson.loads(request.get_data())
+    except orjson.JSONDecodeError:
+        return None
 
 
 @app.route('/api/status', methods=['GET', 'POST'])
 def receive_status():
     """Receive status updates from migration scripts"""
+    global state_version
     if request.method == 'GET':
         return jsonify({
             "message": "This endpoint only accepts POST requests",
@@ -146,7 +387,9 @@ def receive_status():
         }), 405
     
     try:
-        data = request.json
+        data = parse_json_body()
+        if not isinstance(data, dict):
+            return jsonify({"error": "Request body must be a JSON object"}), 400
         gid = data.get('asana GID')
         status = data.get('status')
         project_name = data.get('asana project name', 'Unknown Project')
@@ -154,20 +397,34 @@ def receive_status():
         if not gid or not status:
             return jsonify({"error": "Missing required fields: 'asana GID' and 'status'"}), 400
         
-        # Update in-memory status
-        project_status[gid] = {
+        # Timestamps are formatted once, before taking the lock, and shared with the CSV row.
+        # Second precision matches the CSV, so reloaded entries look the same as live ones
+        now_iso = datetime.now().isoformat(timespec='seconds')
+        now_csv = now_iso.replace('T', ' ')
+        
+        # The new entry is built before taking the lock, which then only covers the swap
+        entry = {
             'gid': gid,
             'project_name': project_name,
             'status': status,
-            'timestamp': datetime.now().isoformat()
+            'timestamp': now_iso
         }
         
-        # Save to CSV
-        save_to_csv(gid, project_name, status)
+        # Update in-memory status and the per-status counts
+        with status_lock:
+            previous = project_status.get(gid)
+            if previous:
+                status_counts[previous['status']] -= 1
+            project_status[gid] = entry
+            status_counts[status] += 1
+            state_version += 1
+            change_log.append((state_version, gid))
+            state_changed.notify_all()
         
-        print(f"✓ Status update received: {gid} ({project_name}) - {status}")
-        print(f"  Current projects in memory: {len(project_status)}")
-        print(f"  CSV file: {CSV_FILE}")
+        # Save to CSV (the csv-writer thread also prints the console line for the update).
+        # A repeated report of the same status only refreshes the in-memory timestamp
+        if not previous or previous['status'] != status or previous['project_name'] != project_name:
+            save_to_csv(gid, project_name, status, now_csv)
         
         return jsonify({
             "received": True,
@@ -181,28 +438,168 @@ def receive_status():
         return jsonify({"error": str(e)}), 500
 
 
+def snapshot_since(since):
+    """
+    Build the dashboard payload: projects changed after version `since`, or all projects
+    when `since` is None or too old for the change log. Caller must hold status_lock.
+    
+    Status entries are replaced on update, never mutated, so the snapshot stays
+    consistent after the lock is released (JSON encoding happens outside the lock).
+    """
+    counts = dict(status_counts)
+    total = len(project_status)
+    version = state_version
+    # Changes after `since` are all still in the log if its oldest entry is at most since + 1
+    oldest_logged = change_log[0][0] if change_log else version + 1
+    if since is not None and since <= version and since + 1 >= oldest_logged:
+        # Log versions are consecutive and end at `version`, so only its newest entries are read
+        changed_gids = {gid for _, gid in islice(reversed(change_log), version - since)}
+        changes = [project_status[gid] for gid in changed_gids]
+        return {"version": version, "changes": changes, "counts": counts, "total": total}
+    # Convert to list format for frontend, with per-status counts for the stats cards
+    projects = list(project_status.values())
+    return {"version": version, "projects": projects, "counts": counts, "total": total}
+
+
+def cached_snapshot(payload):
+    """
+    Return (version, JSON bytes, gzipped bytes) for a full snapshot_since payload, encoding
+    it only once per state version however many dashboards request it
+    """
+    global _snapshot_cache
+    cached = _snapshot_cache
+    if cached is None or cached[0] != payload['version']:
+        body = json_bytes(payload)
+        cached = _snapshot_cache = (payload['version'], body, gzip.compress(body, compresslevel=6))
+    return cached
+
+
 @app.route('/api/projects', methods=['GET'])
 def get_projects():
-    """Get all project statuses for the dashboard"""
-    # Convert to list format for frontend
-    projects = list(project_status.values())
-    return jsonify({"projects": projects})
+    """
+    Get all project statuses for the dashboard
+    
+    With ?since=<version> (the version from a previous response), only the projects
+    changed since that version are returned as "changes". If that version is too old
+    for the change log, the full "projects" list is returned instead.
+    
+    Full lists carry the version as ETag, so a revalidation with no changes gets a 304.
+    """
+    since = request.args.get('since', type=int)
+    cached = _snapshot_cache
+    if since is None and cached is not None and cached[0] == state_version:
+        # The cached snapshot is immutable and still current, so it is served without the lock
+        version, body, gzip_body = cached
+    else:
+        with status_lock:
+            payload = snapshot_since(since)
+        if 'projects' not in payload:
+            return ojsonify(payload)
+        version, body, gzip_body = cached_snapshot(payload)
+    
+    response = app.response_class(body, mimetype='application/json')
+    # Weak ETag: the plain and gzip-encoded bodies share it
+    response.set_etag(str(version), weak=True)
+    response.cache_control.no_cache = True
+    return send_precompressed(response.make_conditional(request), gzip_body)
+
+
+@app.route('/api/events', methods=['GET'])
+def events():
+    """
+    Server-Sent Events stream of project status changes for the dashboard
+    
+    Sends the same payloads as /api/projects (a full snapshot first unless ?since=<version>
+    is given, then only changes), pushed as soon as a status update arrives instead of on a
+    polling timer. A keep-alive comment is sent when nothing changes for SSE_KEEPALIVE seconds.
+    Returns 503 when MAX_EVENT_STREAMS streams are already open.
+    """
+    global active_event_streams
+    with event_streams_lock:
+        if active_event_streams >= MAX_EVENT_STREAMS:
+            response = ojsonify({'error': 'Too many live update streams open, poll /api/projects instead'})
+            response.status_code = 503
+            response.headers['Retry-After'] = str(SSE_KEEPALIVE)
+            return response
+        active_event_streams += 1
+    
+    def release_stream():
+        global active_event_streams
+        with event_streams_lock:
+            active_event_streams -= 1
+    
+    def event_stream(version):
+        while True:
+            with state_changed:
+                if version is not None:
+                    state_changed.wait_for(lambda: state_version != version, timeout=SSE_KEEPALIVE)
+                payload = snapshot_since(version) if state_version != version else None
+            
+            if payload is None:
+                yield b": keep-alive\n\n"
+                continue
+            version = payload['version']
+            body = cached_snapshot(payload)[1] if 'projects' in payload else json_bytes(payload)
+            yield b"data: " + body + b"\n\n"
+    
+    since = request.args.get('since', type=int)
+    response = app.response_class(
+        event_stream(since),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache'}
+    )
+    # Runs when the server closes the response (client gone), even if the stream never started
+    response.call_on_close(release_stream)
+    return response
+
+
+@app.route('/api/export', methods=['GET'])
+def export_csv():
+    """Download the current status of every project as CSV, streamed in chunks of rows"""
+    # One snapshot under the lock, as plain (gid, name, status, timestamp) tuples that the
+    # generator owns; it never touches the shared project_status entries while streaming
+    with status_lock:
+        rows = list(map(EXPORT_ROW, project_status.values()))
+    
+    def generate():
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(['Asana GID', 'Project Name', 'Status', 'Last Update'])
+        for start in range(0, len(rows), EXPORT_CHUNK_ROWS):
+            writer.writerows(rows[start:start + EXPORT_CHUNK_ROWS])
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate(0)
+        yield buffer.getvalue()
+    
+    return app.response_class(
+        generate(),
+        mimetype='text/csv',
+        headers={'Content-Disposition': 'attachment; filename=migration_status_export.csv'}
+    )
 
 
 @app.route('/api/health', methods=['GET'])
 def health():
     """Health check endpoint"""
-    return jsonify({"status": "ok", "projects_tracked": len(project_status)}), 200
+    return ojsonify({"status": "ok", "projects_tracked": len(project_status)}), 200
 
 
 @app.route('/api/debug', methods=['GET'])
 def debug():
     """Debug endpoint to check server state"""
-    csv_exists = os.path.exists(CSV_FILE)
-    csv_size = os.path.getsize(CSV_FILE) if csv_exists else 0
-    return jsonify({
-        "project_status_count": len(project_status),
-        "projects": list(project_status.values()),
+    with status_lock:
+        projects = list(project_status.values())
+    # One stat for both existence and size
+    try:
+        csv_size = os.stat(CSV_FILE).st_size
+        csv_exists = True
+    except FileNotFoundError:
+        csv_size = 0
+        csv_exists = False
+    return ojsonify({
+        "project_status_count": len(projects),
+        "projects": projects,
         "csv_file": CSV_FILE,
         "csv_exists": csv_exists,
         "csv_size": csv_size
@@ -462,7 +859,7 @@ DASHBOARD_HTML = """
                 <div class="auto-refresh">
                     <label>
                         <input type="checkbox" id="auto-refresh" checked>
-                        Auto-refresh (5s)
+                        Live updates
                     </label>
                     <button class="refresh-btn" onclick="loadProjects()">🔄 Refresh</button>
                 </div>
@@ -496,7 +893,14 @@ DASHBOARD_HTML = """
     </div>
     
     <script>
-        let autoRefreshInterval = null;
+        let autoRefreshTimer = null;
+        let pollGeneration = 0;
+        let eventSource = null;
+        // Latest project state by GID and the server version it reflects (null = need full snapshot)
+        const projectsByGid = new Map();
+        // Table rows by GID: {row, project} with the project the row currently shows
+        const rowsByGid = new Map();
+        let lastVersion = null;
         
         function formatTimestamp(isoString) {
             if (!isoString) return 'N/A';
@@ -504,29 +908,72 @@ DASHBOARD_HTML = """
             return date.toLocaleString();
         }
         
+        // Badge class for each status; unknown statuses use the Phase1 style
+        const STATUS_CLASSES = {
+            'Phase1': 'status-phase1',
+            'Phase2': 'status-phase2',
+            'Phase3': 'status-phase3',
+            'Complete': 'status-complete'
+        };
+        
         function getStatusClass(status) {
-            if (status === 'Phase1') return 'status-phase1';
-            if (status === 'Phase2') return 'status-phase2';
-            if (status === 'Phase3') return 'status-phase3';
-            if (status === 'Complete') return 'status-complete';
-            return 'status-phase1';
-        }
-        
-        function updateStats(projects) {
-            const total = projects.length;
-            const phase1 = projects.filter(p => p.status === 'Phase1').length;
-            const phase2 = projects.filter(p => p.status === 'Phase2').length;
-            const phase3 = projects.filter(p => p.status === 'Phase3').length;
-            const complete = projects.filter(p => p.status === 'Complete').length;
-            
+            return STATUS_CLASSES[status] || 'status-phase1';
+        }
+        
+        function updateStats(total, counts) {
             document.getElementById('total-projects').textContent = total;
-            document.getElementById('phase1-count').textContent = phase1;
-            document.getElementById('phase2-count').textContent = phase2;
-            document.getElementById('phase3-count').textContent = phase3;
-            document.getElementById('complete-count').textContent = complete;
+            document.getElementById('phase1-count').textContent = counts['Phase1'] || 0;
+            document.getElementById('phase2-count').textContent = counts['Phase2'] || 0;
+            document.getElementById('phase3-count').textContent = counts['Phase3'] || 0;
+            document.getElementById('complete-count').textContent = counts['Complete'] || 0;
+        }
+        
+        function createCell(className, text) {
+            const td = document.createElement('td');
+            const span = document.createElement('span');
+            span.className = className;
+            span.textContent = text;
+            td.appendChild(span);
+            return td;
         }
         
-        function renderTable(projects) {
+        function createRow(project) {
+            const tr = document.createElement('tr');
+            tr.dataset.gid = project.gid;
+            tr.appendChild(createCell('gid', project.gid));
+            tr.appendChild(createCell('project-name', project.project_name || 'Unknown Project'));
+            tr.appendChild(createCell('status-badge ' + getStatusClass(project.status), project.status));
+            tr.appendChild(createCell('timestamp', formatTimestamp(project.timestamp)));
+            return tr;
+        }
+        
+        function getRow(project) {
+            // Reuse the existing row, touching only the cells whose values changed
+            // Keyed by the string GID, matching the row's data-gid attribute
+            const key = String(project.gid);
+            const entry = rowsByGid.get(key);
+            if (!entry) {
+                const row = createRow(project);
+                rowsByGid.set(key, {row, project});
+                return row;
+            }
+            const previous = entry.project;
+            const cells = entry.row.cells;
+            if (project.project_name !== previous.project_name) {
+                cells[1].textContent = project.project_name || 'Unknown Project';
+            }
+            if (project.status !== previous.status) {
+                cells[2].className = 'status-badge ' + getStatusClass(project.status);
+                cells[2].textContent = project.status;
+            }
+            if (project.timestamp !== previous.timestamp) {
+                cells[3].textContent = formatTimestamp(project.timestamp);
+            }
+            entry.project = project;
+            return entry.row;
+        }
+        
+        function renderTable(projects, counts, total) {
             const tbody = document.getElementById('projects-table');
             const loading = document.getElementById('loading');
             const tableContainer = document.getElementById('table-container');
@@ -543,34 +990,69 @@ DASHBOARD_HTML = """
             emptyState.style.display = 'none';
             tableContainer.style.display = 'block';
             
-            // Sort by timestamp (newest first)
+            // Sort by timestamp (newest first). ISO-8601 strings sort chronologically as plain
+            // strings, so no Date objects are created per comparison
             projects.sort((a, b) => {
-                const timeA = new Date(a.timestamp || 0);
-                const timeB = new Date(b.timestamp || 0);
-                return timeB - timeA;
+                const timeA = a.timestamp || '';
+                const timeB = b.timestamp || '';
+                return timeA < timeB ? 1 : timeA > timeB ? -1 : 0;
             });
             
-            tbody.innerHTML = projects.map(project => `
-                <tr>
-                    <td><span class="gid">${project.gid}</span></td>
-                    <td><span class="project-name">${project.project_name || 'Unknown Project'}</span></td>
-                    <td><span class="status-badge ${getStatusClass(project.status)}">${project.status}</span></td>
-                    <td><span class="timestamp">${formatTimestamp(project.timestamp)}</span></td>
-                </tr>
-            `).join('');
+            // Walk the rows in sorted order and only move the ones that are out of place,
+            // so an update touches the changed rows instead of rebuilding the whole table.
+            // Runs of new or moved rows are collected in a fragment and inserted in one go
+            let next = tbody.firstChild;
+            const pending = document.createDocumentFragment();
+            projects.forEach(project => {
+                const row = getRow(project);
+                if (row === next) {
+                    if (pending.firstChild) {
+                        tbody.insertBefore(pending, next);
+                    }
+                    next = row.nextSibling;
+                } else {
+                    pending.appendChild(row);
+                }
+            });
+            if (pending.firstChild) {
+                tbody.insertBefore(pending, next);
+            }
+            // Rows left after the last placed one belong to projects no longer in the snapshot
+            while (next) {
+                const stale = next;
+                next = next.nextSibling;
+                rowsByGid.delete(stale.dataset.gid);
+                stale.remove();
+            }
             
-            updateStats(projects);
+            updateStats(total, counts);
+        }
+        
+        function applyUpdate(data) {
+            if (data.projects) {
+                // Full snapshot
+                projectsByGid.clear();
+                data.projects.forEach(project => projectsByGid.set(project.gid, project));
+                console.log('Loaded projects:', data.projects.length);
+            } else if (data.changes.length === 0) {
+                // Nothing changed since the last update
+                return;
+            } else {
+                data.changes.forEach(project => projectsByGid.set(project.gid, project));
+                console.log('Updated projects:', data.changes.length);
+            }
+            lastVersion = data.version;
+            renderTable(Array.from(projectsByGid.values()), data.counts || {}, data.total ?? projectsByGid.size);
         }
         
         async function loadProjects() {
             try {
-                const response = await fetch('/api/projects');
+                const url = lastVersion === null ? '/api/projects' : `/api/projects?since=${lastVersion}`;
+                const response = await fetch(url);
                 if (!response.ok) {
                     throw new Error(`HTTP error! status: ${response.status}`);
                 }
-                const data = await response.json();
-                console.log('Loaded projects:', data.projects.length);
-                renderTable(data.projects);
+                applyUpdate(await response.json());
             } catch (error) {
                 console.error('Error loading projects:', error);
                 const loading = document.getElementById('loading');
@@ -592,20 +1074,68 @@ DASHBOARD_HTML = """
                 }
             });
             
+            // Background tabs don't need updates: disconnect while hidden and catch up when shown
+            document.addEventListener('visibilitychange', function() {
+                if (!checkbox.checked) {
+                    return;
+                }
+                if (document.hidden) {
+                    stopAutoRefresh();
+                } else {
+                    // The event stream resumes from lastVersion and sends missed changes at once
+                    if (!window.EventSource) {
+                        loadProjects();
+                    }
+                    startAutoRefresh();
+                }
+            });
+            
             if (checkbox.checked) {
                 startAutoRefresh();
             }
         }
         
+        function schedulePoll(generation) {
+            // Next poll is scheduled only after the previous response, so a slow server
+            // never has requests from one dashboard piling up
+            autoRefreshTimer = setTimeout(async function() {
+                await loadProjects();
+                if (generation === pollGeneration) {
+                    schedulePoll(generation);
+                }
+            }, 5000);
+        }
+        
         function startAutoRefresh() {
             stopAutoRefresh();
-            autoRefreshInterval = setInterval(loadProjects, 5000);
+            if (window.EventSource) {
+                // Server pushes changes as they happen; fall back to polling without SSE support
+                const since = lastVersion === null ? '' : `?since=${lastVersion}`;
+                eventSource = new EventSource('/api/events' + since);
+                eventSource.onmessage = event => applyUpdate(JSON.parse(event.data));
+                // The browser gives up on the stream when the server refuses it (e.g. 503 when too
+                // many streams are open): poll instead, and retry the stream on the next restart
+                eventSource.onerror = function() {
+                    if (eventSource && eventSource.readyState === EventSource.CLOSED) {
+                        eventSource = null;
+                        schedulePoll(pollGeneration);
+                    }
+                };
+            } else {
+                schedulePoll(pollGeneration);
+            }
         }
         
         function stopAutoRefresh() {
-            if (autoRefreshInterval) {
-                clearInterval(autoRefreshInterval);
-                autoRefreshInterval = null;
+            if (eventSource) {
+                eventSource.close();
+                eventSource = null;
+            }
+            // Invalidate any poll still waiting on a response
+            pollGeneration++;
+            if (autoRefreshTimer) {
+                clearTimeout(autoRefreshTimer);
+                autoRefreshTimer = null;
             }
         }
         
@@ -617,6 +1147,11 @@ DASHBOARD_HTML = """
 </html>
 """
 
+# Encoded and compressed once at import time, with a content hash as the ETag
+DASHBOARD_HTML_BYTES = DASHBOARD_HTML.encode('utf-8')
+DASHBOARD_HTML_GZIP = gzip.compress(DASHBOARD_HTML_BYTES, compresslevel=9)
+DASHBOARD_ETAG = hashlib.md5(DASHBOARD_HTML_BYTES).hexdigest()
+
 
 if __name__ == '__main__':
     # Ensure CSV file exists
@@ -635,4 +1170,13 @@ if __name__ == '__main__':
     print("=" * 60)
     print("\nStarting server...")
     
-    app.run(host='0.0.0.0', port=8002, debug=True)
+    if serve is not None:
+        # Production WSGI server with a fixed worker thread pool. Status is kept in memory,
+        # so the monitor runs as a single process
+        serve(app, host='0.0.0.0', port=8002, threads=SERVER_THREADS)
+    else:
+        print("⚠ waitress not installed, using the Flask development server (pip install waitress)")
+        # Threaded so open event streams don't block other requests. No debug mode: its reloader
+        # runs the module (and its CSV writer thread) in a second process, and the interactive
+        # debugger must not be reachable on 0.0.0.0
+        app.run(host='0.0.0.0', port=8002, threaded=True)
@@ -2,17 +2,25 @@
 """
 Test script to transform raw comment dataset with URL transformation algorithm
 """
+import argparse
 import sys
 import os
 import html
 import re
-from typing import Dict, Optional
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
 
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from url_name_transformation_dataset import raw_dataset
 
+# Asana profile URLs (https://app.asana.com/0/profile/{GID}) and HTML tags, compiled once
+_ASANA_PROFILE_RE = re.compile(r'https://app\.asana\.com/0/profile/(\d+)')
+# Literal part of every profile URL, checked before running the regex
+_ASANA_PROFILE_MARKER = 'app.asana.com/0/profile/'
+_TAG_STRIP_RE = re.compile(r'<[^>]+>')
+
 # Mock ScoroClient for testing
 class MockScoroClient:
     """Mock ScoroClient that simulates user lookup"""
@@ -27,24 +35,91 @@ class MockScoroClient:
         'Tena': {'id': 4, 'firstname': 'Tena', 'lastname': '', 'full_name': 'Tena'},
         # Add more as needed - these are examples
     }
+    # MOCK_USERS keyed by lowercased name, for constant-time exact matches
+    MOCK_USERS_LOWER = {name.lower(): user for name, user in MOCK_USERS.items()}
+    
+    def __init__(self):
+        self._user_lookup_cache = {}  # Cache for user lookups by name: {name: user_dict or None}
     
     def find_user_by_name(self, user_name: str) -> Optional[Dict]:
-        """Mock find_user_by_name - tries exact match and partial match"""
+        """Mock find_user_by_name - tries exact match and partial match, caching results like ScoroClient"""
         user_name_lower = user_name.lower().strip()
-        
+        if user_name_lower not in self._user_lookup_cache:
+            self._user_lookup_cache[user_name_lower] = self._match_user(user_name_lower)
+        return self._user_lookup_cache[user_name_lower]
+    
+    def _match_user(self, user_name_lower: str) -> Optional[Dict]:
+        """Find a mock user by lowercased name"""
         # Try exact match first
-        for name, user in self.MOCK_USERS.items():
-            if name.lower() == user_name_lower:
-                return user
+        user = self.MOCK_USERS_LOWER.get(user_name_lower)
+        if user:
+            return user
         
         # Try partial match
-        for name, user in self.MOCK_USERS.items():
-            if user_name_lower in name.lower() or name.lower() in user_name_lower:
+        for name_lower, user in self.MOCK_USERS_LOWER.items():
+            if user_name_lower in name_lower or name_lower in user_name_lower:
                 return user
         
         return None
 
 
+def get_users_by_str_gid(asana_data: Dict) -> Dict:
+    """
+    Return the asana_data users map keyed by string GID (GIDs may be stored as ints).
+    Built once per asana_data and stored on it, since the export data is read-only here.
+    """
+    users_by_gid = asana_data.get('_users_by_str_gid')
+    if users_by_gid is None:
+        users_map = asana_data.get('users', {})
+        users_by_gid = asana_data['_users_by_str_gid'] = {str(key): value for key, value in users_map.items()}
+    return users_by_gid
+
+
+@lru_cache(maxsize=1024)
+def resolve_mention_names(firstname: str, lastname: str, full_name: str) -> Tuple[str, str, str]:
+    """
+    Return the (firstname, lastname, full_name) to show in a mention for a Scoro user's name
+    fields, splitting full_name when first/last name are missing. Cached per distinct user.
+    """
+    firstname = firstname.strip()
+    lastname = lastname.strip()
+    full_name = full_name.strip() or f"{firstname} {lastname}".strip()
+    
+    # If we don't have first/last name, try to split full_name
+    if not firstname or not lastname:
+        name_parts = full_name.split(maxsplit=1)
+        if len(name_parts) >= 2:
+            firstname = name_parts[0]
+            lastname = name_parts[1]
+        elif len(name_parts) == 1:
+            firstname = name_parts[0]
+            lastname = ''
+        else:
+            firstname = full_name
+            lastname = ''
+    
+    return firstname, lastname, full_name
+
+
+@lru_cache(maxsize=2048)
+def build_mention_html(user_id, firstname: str, lastname: str, full_name: str) -> str:
+    """
+    Build the Scoro user mention HTML for a user. Cached, since the same users are
+    mentioned across many comments.
+    """
+    # html.escape (chained C-level str.replace) is faster than str.translate with a
+    # multi-character table for names, and runs once per distinct user
+    full_name_escaped = html.escape(full_name)
+    firstname_escaped = html.escape(firstname)
+    lastname_escaped = html.escape(lastname) if lastname else ''
+    
+    lastname_html = f' <span class="mceNonEditable">{lastname_escaped}</span>' if lastname else ''
+    return (
+        f'<span title="{full_name_escaped}" class="mceNonEditable js-tinymce-user tinymce-user user-{user_id}">'
+        f'@<span class="mceNonEditable">{firstname_escaped}</span>{lastname_html}</span>'
+    )
+
+
 def replace_asana_profile_urls_with_scoro_mentions(
     comment_text: str,
     scoro_client,
@@ -57,35 +132,22 @@ def replace_asana_profile_urls_with_scoro_mentions(
     if not comment_text:
         return comment_text
     
-    # Pattern to match Asana profile URLs: https://app.asana.com/0/profile/{GID}
-    asana_profile_pattern = r'https://app\.asana\.com/0/profile/(\d+)'
+    # Plain substring check first: far cheaper than running the regex over text without URLs
+    if _ASANA_PROFILE_MARKER not in comment_text:
+        return comment_text
     
-    # Check if there are any URLs to replace
-    urls_found = re.findall(asana_profile_pattern, comment_text)
-    if not urls_found:
+    # Collect the distinct profile GIDs; nothing to replace if there are none
+    gids = set(_ASANA_PROFILE_RE.findall(comment_text))
+    if not gids:
         return comment_text
     
-    def replace_url(match):
-        """Replace a single Asana profile URL with Scoro user mention"""
-        gid = match.group(1)
-        url = match.group(0)
+    def build_mention(gid, url):
+        """Build the Scoro user mention for a profile GID, or return the URL if the user is unknown"""
         
         # Try to get user name from asana_data users map
         user_name = None
         if asana_data:
-            users_map = asana_data.get('users', {})
-            
-            # Try to find user by GID (try both string and as-is)
-            user_details = None
-            if gid in users_map:
-                user_details = users_map[gid]
-            else:
-                # GID might be stored with a different type, try to find by value
-                for key, value in users_map.items():
-                    if str(key) == str(gid):
-                        user_details = value
-                        break
-            
+            user_details = get_users_by_str_gid(asana_data).get(gid)
             if user_details:
                 user_name = user_details.get('name', '')
         
@@ -102,53 +164,40 @@ def replace_asana_profile_urls_with_scoro_mentions(
         if not user_id:
             return url
         
-        # Get first and last name from Scoro user
-        firstname = scoro_user.get('firstname', '').strip()
-        lastname = scoro_user.get('lastname', '').strip()
-        full_name = scoro_user.get('full_name', '').strip() or f"{firstname} {lastname}".strip()
-        
-        # If we don't have first/last name, try to split full_name
-        if not firstname or not lastname:
-            name_parts = full_name.split(maxsplit=1)
-            if len(name_parts) >= 2:
-                firstname = name_parts[0]
-                lastname = name_parts[1]
-            elif len(name_parts) == 1:
-                firstname = name_parts[0]
-                lastname = ''
-            else:
-                firstname = full_name
-                lastname = ''
-        
-        # Build Scoro user mention HTML
-        full_name_escaped = html.escape(full_name)
-        firstname_escaped = html.escape(firstname)
-        lastname_escaped = html.escape(lastname) if lastname else ''
-        
-        mention_html = (
-            f'<span title="{full_name_escaped}" class="mceNonEditable js-tinymce-user tinymce-user user-{user_id}">'
-            f'@<span class="mceNonEditable">{firstname_escaped}</span>'
+        firstname, lastname, full_name = resolve_mention_names(
+            scoro_user.get('firstname', ''),
+            scoro_user.get('lastname', ''),
+            scoro_user.get('full_name', '')
         )
-        if lastname:
-            mention_html += f' <span class="mceNonEditable">{lastname_escaped}</span>'
-        mention_html += '</span>'
-        
-        return mention_html
+        return build_mention_html(user_id, firstname, lastname, full_name)
+    
+    # Resolve each GID once up front, so replacing a match is a single dict lookup
+    # (the URL for a GID is fully determined by the pattern, so it is rebuilt from the GID)
+    mention_by_gid = {gid: build_mention(gid, f'https://app.asana.com/0/profile/{gid}') for gid in gids}
     
     # Replace all Asana profile URLs in the comment text
-    result = re.sub(asana_profile_pattern, replace_url, comment_text)
+    result = _ASANA_PROFILE_RE.sub(lambda match: mention_by_gid[match.group(1)], comment_text)
     
-    # Wrap the comment in <p> tags if it's not already wrapped
-    result = result.strip()
-    if result:
-        if not (result.startswith('<p>') and result.endswith('</p>')):
-            result = f'<p>{result}</p>'
+    # Wrap the comment in <p> tags if it's not already wrapped (stripping only when the
+    # ends are actually whitespace)
+    if result and (result[0].isspace() or result[-1].isspace()):
+        result = result.strip()
+    if result and not (result.startswith('<p>') and result.endswith('</p>')):
+        result = f'<p>{result}</p>'
     
     return result
 
 
 def main():
     """Main test function"""
+    parser = argparse.ArgumentParser(description='Transform the raw comment dataset with the URL transformation algorithm')
+    parser.add_argument(
+        '--verbose',
+        action='store_true',
+        help='Also show the visible text (HTML stripped) of each transformed comment'
+    )
+    args = parser.parse_args()
+    
     # Create mock asana_data with users map
     # GID -> user details mapping
     # Note: These are example mappings - in real scenario, these would come from Asana export
@@ -166,22 +215,15 @@ def main():
     # Create mock Scoro client
     scoro_client = MockScoroClient()
     
+    # Characters the console can't encode are replaced instead of raising UnicodeEncodeError
+    sys.stdout.reconfigure(errors='replace')
+    
     print("=" * 80)
     print("URL TRANSFORMATION TEST RESULTS")
     print("=" * 80)
     print()
     
     for i, raw_comment in enumerate(raw_dataset, 1):
-        print(f"Test Case {i}:")
-        print("-" * 80)
-        print("ORIGINAL:")
-        try:
-            print(raw_comment)
-        except UnicodeEncodeError:
-            # Handle Unicode encoding issues
-            print(raw_comment.encode('utf-8', errors='replace').decode('utf-8', errors='replace'))
-        print()
-        
         # Transform the comment
         transformed = replace_asana_profile_urls_with_scoro_mentions(
             raw_comment,
@@ -189,23 +231,25 @@ def main():
             asana_data
         )
         
-        print("TRANSFORMED:")
-        try:
-            print(transformed)
-        except UnicodeEncodeError:
-            print(transformed.encode('utf-8', errors='replace').decode('utf-8', errors='replace'))
-        print()
+        # Collect the test case's output and write it in one go
+        lines = [
+            f"Test Case {i}:",
+            "-" * 80,
+            "ORIGINAL:",
+            raw_comment,
+            "",
+            "TRANSFORMED:",
+            transformed,
+            "",
+        ]
         
-        # Show visible text (what user would see)
-        visible_text = re.sub(r'<[^>]+>', '', transformed)
-        print("VISIBLE TEXT (HTML stripped):")
-        try:
-            print(visible_text)
-        except UnicodeEncodeError:
-            print(visible_text.encode('utf-8', errors='replace').decode('utf-8', errors='replace'))
-        print()
-        print("=" * 80)
-        print()
+        # Show visible text (what user would see); the tag-stripping pass only runs when asked for
+        if args.verbose:
+            lines += ["VISIBLE TEXT (HTML stripped):", _TAG_STRIP_RE.sub('', transformed), ""]
+        lines += ["=" * 80, ""]
+        sys.stdout.write("\n".join(lines) + "\n")
+    
+    sys.stdout.flush()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,92 @@
+"""
+Tests for the fields kept on transformed tasks
+"""
+import os
+import sys
+
+import pytest
+
+pytest.importorskip('dotenv')
+pytest.importorskip('asana')
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models import MigrationSummary
+from transformers.data_transformer import transform_data
+
+
+def make_asana_data(tasks):
+    return {
+        'project': {'name': 'Acme Corp', 'notes': '', 'members': []},
+        'tasks': tasks,
+        'milestones': [],
+        'sections': [],
+        'users': {'1': {'name': 'Tom Good'}},
+    }
+
+
+def transform_tasks(tasks):
+    return transform_data(make_asana_data(tasks), MigrationSummary(), {})['tasks']
+
+
+def test_sparse_task_drops_empty_fields_but_keeps_required_flags():
+    """Empty optional fields are left out; title and the flags the importer reads are always present"""
+    task = {
+        'gid': '101', 'name': 'Write brief', 'notes': '', 'completed': False,
+        'created_at': '2025-08-01T10:00:00.000Z', 'due_on': None, 'assignee': None,
+        'custom_fields': [], 'subtasks': [],
+    }
+    
+    transformed = transform_tasks([task])[0]
+    
+    assert list(transformed.items()) == [
+        ('title', 'Write brief'),
+        ('is_completed', False),
+        ('is_personal', False),
+        ('activity_type', 'Other'),
+        ('status', 'task_status1'),
+        ('priority_id', 2),
+        ('project_name', 'Acme Corp'),
+        ('project_phase_name', 'Misc'),
+        ('company_name', 'Acme Corp'),
+        ('asana_gid', '101'),
+        ('_asana_completed', False),
+        ('_asana_completed_at', None),
+        ('_has_calculated_time_entries', False),
+    ]
+
+
+def test_full_task_keeps_populated_fields_in_order():
+    """Populated optional fields are kept, in the order the importer has always received them"""
+    task = {
+        'gid': '102', 'name': 'Design homepage', 'notes': 'First <b>draft</b>', 'completed': True,
+        'completed_at': '2025-08-03T09:30:00.000Z', 'created_at': '2025-08-01T10:00:00.000Z',
+        'start_on': '2025-08-02', 'due_on': '2025-08-10', 'assignee': {'gid': '1', 'name': 'Tom Good'},
+        'created_by': {'gid': '1', 'name': 'Tom Good'}, '_assigned_section_name': 'Design',
+        'custom_fields': [
+            {'name': 'Estimated time', 'number_value': 90},
+            {'name': 'Priority', 'enum_value': {'name': 'High'}},
+        ],
+        'tags': [{'name': 'web'}], 'subtasks': [],
+    }
+    
+    transformed = transform_tasks([task])[0]
+    
+    assert list(transformed) == [
+        'title', 'is_completed', 'is_personal', 'description', 'start_datetime', 'datetime_due',
+        'duration_planned', 'billable_time_type', 'activity_type', 'status', 'priority_id',
+        'owner_name', 'assigned_to_name', 'project_name', 'project_phase_name', 'company_name',
+        'tags', 'asana_gid', 'calculated_time_entries',
+        '_asana_completed', '_asana_completed_at', '_has_calculated_time_entries',
+    ]
+    # Completion goes through a calculated time entry, so the task itself is created open
+    assert transformed['is_completed'] is False
+    assert transformed['description'] == 'First draft'
+    assert transformed['duration_planned'] == '01:30:00'
+    assert transformed['billable_time_type'] == 'billable'
+    assert transformed['priority_id'] == 1
+    assert transformed['project_phase_name'] == 'Design'
+    assert transformed['tags'] == ['web']
+    assert transformed['_asana_completed'] is True
+    assert transformed['_has_calculated_time_entries'] is True
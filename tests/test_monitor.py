@@ -0,0 +1,164 @@
+"""
+Tests for the monitoring server's CSV persistence and incremental dashboard snapshots
+"""
+import csv
+import os
+import sys
+from collections import Counter, deque
+
+import pytest
+
+pytest.importorskip('flask_cors')
+
+# Add the monitoring directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'monitoring'))
+
+import monitor
+
+
+@pytest.fixture
+def csv_file(tmp_path, monkeypatch):
+    """Point the monitor at an empty CSV file with small compaction thresholds"""
+    path = str(tmp_path / 'migration_status.csv')
+    monkeypatch.setattr(monitor, 'CSV_FILE', path)
+    monkeypatch.setattr(monitor, '_csv_cache', {'mtime': None, 'header': None, 'rows': {}, 'file_rows': 0})
+    # Compact once the file holds more than 6 rows and more than 2 rows per project
+    monkeypatch.setattr(monitor, 'CSV_COMPACT_MIN_ROWS', 6)
+    monkeypatch.setattr(monitor, 'CSV_COMPACT_RATIO', 2)
+    return path
+
+
+@pytest.fixture
+def fresh_state(monkeypatch):
+    """Give each test its own in-memory project state"""
+    monkeypatch.setattr(monitor, 'project_status', {})
+    monkeypatch.setattr(monitor, 'status_counts', Counter())
+    monkeypatch.setattr(monitor, 'change_log', deque(maxlen=monitor.CHANGE_LOG_SIZE))
+    monkeypatch.setattr(monitor, 'state_version', 1000)
+    monkeypatch.setattr(monitor, '_snapshot_cache', None)
+
+
+def read_csv(path):
+    with open(path, newline='', encoding='utf-8') as f:
+        return list(csv.reader(f))
+
+
+def test_csv_appends_until_compaction_and_reloads_latest_rows(csv_file, fresh_state):
+    """Batches are appended, coalesced per GID, and compacted to one row per GID past the thresholds"""
+    # No file yet: written from scratch with the header
+    monitor.write_csv_updates([
+        ('2025-01-01 10:00:00', '1', 'Alpha', 'Phase1'),
+        ('2025-01-01 10:00:00', '2', 'Beta', 'Phase1'),
+    ])
+    assert read_csv(csv_file) == [
+        monitor.CSV_HEADER,
+        ['2025-01-01 10:00:00', '1', 'Alpha', 'Phase1'],
+        ['2025-01-01 10:00:00', '2', 'Beta', 'Phase1'],
+    ]
+    
+    # A GID updated twice in one batch is appended once, as the batch's latest update
+    monitor.write_csv_updates([
+        ('2025-01-01 11:00:00', '1', 'Alpha', 'Phase2'),
+        ('2025-01-01 11:00:00', '2', 'Beta', 'Phase2'),
+        ('2025-01-01 11:05:00', '1', 'Alpha', 'Phase3'),
+    ])
+    rows = read_csv(csv_file)
+    assert len(rows) == 1 + 4
+    assert rows[-2:] == [
+        ['2025-01-01 11:00:00', '2', 'Beta', 'Phase2'],
+        ['2025-01-01 11:05:00', '1', 'Alpha', 'Phase3'],
+    ]
+    assert monitor._csv_cache['file_rows'] == 4
+    
+    # A reload of the appended file keeps the latest row per GID
+    monitor._csv_cache.update(mtime=None, header=None, rows={}, file_rows=0)
+    monitor.load_from_csv()
+    assert {gid: entry['status'] for gid, entry in monitor.project_status.items()} == {'1': 'Phase3', '2': 'Phase2'}
+    assert monitor._csv_cache['file_rows'] == 4
+    
+    # 6 rows for 3 projects is exactly at both thresholds, so this batch is still appended
+    monitor.write_csv_updates([
+        ('2025-01-01 12:00:00', '3', 'Gamma', 'Phase1'),
+        ('2025-01-01 12:00:00', '2', 'Beta', 'Phase3'),
+    ])
+    assert len(read_csv(csv_file)) == 1 + 6
+    
+    # The 7th row passes them, so the file is rewritten with one row per GID (latest update last)
+    monitor.write_csv_updates([('2025-01-01 13:00:00', '1', 'Alpha', 'Complete')])
+    assert read_csv(csv_file) == [
+        monitor.CSV_HEADER,
+        ['2025-01-01 12:00:00', '3', 'Gamma', 'Phase1'],
+        ['2025-01-01 12:00:00', '2', 'Beta', 'Phase3'],
+        ['2025-01-01 13:00:00', '1', 'Alpha', 'Complete'],
+    ]
+    assert not os.path.exists(csv_file + '.tmp')
+    assert monitor._csv_cache['file_rows'] == 3
+    
+    # A fresh process reading the compacted file sees the same latest entries
+    monitor._csv_cache.update(mtime=None, header=None, rows={}, file_rows=0)
+    monitor.load_from_csv()
+    assert monitor.project_status == {
+        '1': {'gid': '1', 'project_name': 'Alpha', 'status': 'Complete', 'timestamp': '2025-01-01T13:00:00'},
+        '2': {'gid': '2', 'project_name': 'Beta', 'status': 'Phase3', 'timestamp': '2025-01-01T12:00:00'},
+        '3': {'gid': '3', 'project_name': 'Gamma', 'status': 'Phase1', 'timestamp': '2025-01-01T12:00:00'},
+    }
+    assert monitor.status_counts == Counter({'Complete': 1, 'Phase3': 1, 'Phase1': 1})
+
+
+@pytest.fixture
+def client(fresh_state, monkeypatch):
+    """Flask test client whose status updates are not written to the CSV"""
+    monkeypatch.setattr(monitor, 'save_to_csv', lambda *args: None)
+    return monitor.app.test_client()
+
+
+def post_status(client, gid, status):
+    response = client.post('/api/status', json={'asana GID': gid, 'status': status, 'asana project name': f'Project {gid}'})
+    assert response.status_code == 200
+
+
+def test_projects_since_returns_only_changes(client):
+    """?since= with the version of a previous response returns only the projects changed after it"""
+    post_status(client, '1', 'Phase1')
+    post_status(client, '2', 'Phase1')
+    full = client.get('/api/projects').get_json()
+    assert sorted(project['gid'] for project in full['projects']) == ['1', '2']
+    
+    post_status(client, '1', 'Phase2')
+    delta = client.get(f"/api/projects?since={full['version']}").get_json()
+    assert 'projects' not in delta
+    assert [project['gid'] for project in delta['changes']] == ['1']
+    assert delta['changes'][0]['status'] == 'Phase2'
+    assert delta['version'] == full['version'] + 1
+    assert delta['counts'] == {'Phase1': 1, 'Phase2': 1}
+    assert delta['total'] == 2
+    
+    # Already up to date: no changes
+    current = client.get(f"/api/projects?since={delta['version']}").get_json()
+    assert current['changes'] == []
+    assert current['version'] == delta['version']
+
+
+def test_projects_since_old_or_future_version_returns_full_list(client, monkeypatch):
+    """Versions the change log can't answer fall back to the full project list"""
+    monkeypatch.setattr(monitor, 'change_log', deque(maxlen=2))
+    post_status(client, '1', 'Phase1')
+    first_version = monitor.state_version
+    post_status(client, '2', 'Phase1')
+    post_status(client, '3', 'Phase1')
+    post_status(client, '1', 'Phase2')
+    
+    # The two-entry log still covers the last two changes...
+    recent = client.get(f'/api/projects?since={first_version + 1}').get_json()
+    assert sorted(project['gid'] for project in recent['changes']) == ['1', '3']
+    
+    # ...but no longer all the changes after first_version
+    old = client.get(f'/api/projects?since={first_version}').get_json()
+    assert 'changes' not in old
+    assert sorted(project['gid'] for project in old['projects']) == ['1', '2', '3']
+    
+    # A version from before a restart (ahead of this process) can't be answered from the log either
+    future = client.get(f'/api/projects?since={monitor.state_version + 1}').get_json()
+    assert 'changes' not in future
+    assert sorted(project['gid'] for project in future['projects']) == ['1', '2', '3']
+    assert future['version'] == monitor.state_version
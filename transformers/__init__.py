@@ -1,28 +1,30 @@
 """
 Data transformation modules for converting Asana data to Scoro format
 """
-from .field_extractors import (
-    extract_custom_field_value,
-    extract_tags,
-    extract_priority,
-    format_comments_for_description,
-    extract_time_field_value,
-    convert_minutes_to_hhmmss
-)
-from .mappers import (
-    improve_misc_tracking,
-    smart_map_phase,
-    smart_map_activity_and_tracking,
-    validate_user
-)
-from .deduplication import (
-    is_client_project,
-    reset_task_tracker,
-    get_deduplication_stats
-)
-from .data_transformer import transform_data
+import importlib
+
+# Public name -> submodule defining it. Submodules are imported on first attribute access
+# (PEP 562), so importing one helper doesn't load the rest of the package
+_LAZY_IMPORTS = {
+    'index_custom_fields': 'field_extractors',
+    'extract_custom_field_value': 'field_extractors',
+    'extract_tags': 'field_extractors',
+    'extract_priority': 'field_extractors',
+    'format_comments_for_description': 'field_extractors',
+    'extract_time_field_value': 'field_extractors',
+    'convert_minutes_to_hhmmss': 'field_extractors',
+    'improve_misc_tracking': 'mappers',
+    'smart_map_phase': 'mappers',
+    'smart_map_activity_and_tracking': 'mappers',
+    'validate_user': 'mappers',
+    'is_client_project': 'deduplication',
+    'reset_task_tracker': 'deduplication',
+    'get_deduplication_stats': 'deduplication',
+    'transform_data': 'data_transformer'
+}
 
 __all__ = [
+    'index_custom_fields',
     'extract_custom_field_value',
     'extract_tags',
     'extract_priority',
@@ -39,3 +41,16 @@ __all__ = [
     'transform_data'
 ]
 
+
+def __getattr__(name):
+    """Import the submodule defining `name` on first access and cache the attribute"""
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f'.{_LAZY_IMPORTS[name]}', __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
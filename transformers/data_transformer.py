@@ -15,10 +15,11 @@ import re
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
 
-from config import CUTOFF_DATE
+from config import CUTOFF_DATE, TRANSFORM_PROGRESS_INTERVAL
 from models import MigrationSummary
 from utils import logger
 from transformers.field_extractors import (
+    index_custom_fields,
     extract_custom_field_value,
     extract_tags,
     extract_priority,
@@ -36,6 +37,31 @@ from transformers.deduplication import (
     set_seen_tasks
 )
 
+# HTML tags stripped from descriptions, compiled once instead of on every task
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+
+# CUTOFF_DATE as "YYYY-MM-DDTHH:MM:SS": ISO-8601 timestamps sort lexicographically,
+# so the July 1 rule can compare created_at strings against it without parsing them
+_CUTOFF_ISO = CUTOFF_DATE.strftime('%Y-%m-%dT%H:%M:%S')
+# Tasks with a missing or unparseable created_at are treated as created on 2020-01-01
+_UNKNOWN_CREATED_BEFORE_CUTOFF = datetime(2020, 1, 1) < CUTOFF_DATE
+# created_at values that are certain to parse ("2025-07-01" or "2025-07-01T12:34:56[.789][Z|+02:00]").
+# Days above 28 are left to the full parse, which rejects dates such as February 30
+_VALID_CREATED_AT_RE = re.compile(
+    r'[1-9]\d{3}-(?:0[1-9]|1[0-2])-(?:0[1-9]|1\d|2[0-8])'
+    r'(?:T(?:[01]\d|2[0-3]):[0-5]\d:[0-5]\d(?:\.\d{3}(?:\d{3})?)?(?:Z|[+-](?:[01]\d|2[0-3]):[0-5]\d)?)?',
+    re.ASCII
+)
+
+# Scoro priority_id for each extract_priority() result (1=high, 2=normal, 3=low)
+_PRIORITY_IDS = {'High': 1, 'Medium': 2, 'Low': 3}
+
+# Task fields written even when empty/False; every other optional field is only set when it has a value
+_TASK_FIELDS_ALWAYS_KEPT = frozenset({
+    'title', 'is_completed', 'is_personal', 'parent_asana_gid',
+    '_asana_completed', '_asana_completed_at', '_has_calculated_time_entries',
+})
+
 
 def transform_data(asana_data: Dict, summary: MigrationSummary, seen_tasks_tracker: Optional[Dict[str, Dict[str, Any]]] = None) -> Dict:
     """
@@ -71,60 +97,39 @@ def transform_data(asana_data: Dict, summary: MigrationSummary, seen_tasks_track
         # Extract company name from project
         # For client projects, use project name as company name
         # For team member projects, try to extract from tasks' custom fields
-        company_name = None
-        company_list = []
-        
-        tasks = asana_data.get('tasks', [])
-        for task in tasks:  # Check all tasks
-            company_from_task = extract_custom_field_value(task, 'C-Name') or extract_custom_field_value(task, 'Company Name')
-            if company_from_task:
-                company_list.append(company_from_task)
-            
-        # If all tasks have the same company name, use it
-        if len(set(company_list)) == 1 and company_list:
-            company_name = company_list[0]
-            logger.info(f"  Found company name from task custom field: {company_name}")
-        else: 
-            company_name = project_name
-            logger.info(f"  Company name is set as a project name!")
-            
-        
+        #
         # Extract Project Manager from "PM Name" custom field in tasks
         # Priority: Find custom field with name "PM Name" and use its display_value (first name)
         # The display_value contains the first name of the user who should be the Scoro Project Manager
         # Search through all tasks until we find a non-null display_value
+        #
+        # Both searches share a single pass over the tasks (and each task's custom field index),
+        # which stops once neither result can change any more
+        company_name = None
+        company_names = set()
         pm_name = None
-        tasks = asana_data.get('tasks', [])
         null_count = 0  # Track how many null display_values we encounter
         
-        # Search through all tasks to find a custom field with name "PM Name"
-        # Continue searching until we find a non-null display_value
+        tasks = asana_data.get('tasks', [])
         for task in tasks:
-            custom_fields = task.get('custom_fields', [])
-            if not custom_fields:
-                continue
+            fields = index_custom_fields(task)
             
-            for field in custom_fields:
-                if isinstance(field, dict):
-                    field_name = field.get('name', '')
-                    # Check if this is the "PM Name" field
-                    if field_name and field_name.lower() == 'pm name':
-                        # Get display_value (contains the first name)
+            # A second distinct company already rules out a shared one, so stop collecting then
+            if len(company_names) < 2:
+                company_from_task = extract_custom_field_value(task, 'C-Name', fields) or extract_custom_field_value(task, 'Company Name', fields)
+                if company_from_task:
+                    company_names.add(company_from_task)
+            
+            # Continue searching for "PM Name" until we find a non-null display_value
+            if not pm_name:
+                for field_name_lower, field in fields:
+                    if field_name_lower != 'pm name':
+                        continue
+                    # Get display_value (contains the first name)
+                    if isinstance(field, dict):
                         display_value = field.get('display_value')
-                        
-                        # Check if display_value is null or empty
-                        if display_value is None or (isinstance(display_value, str) and not display_value.strip()):
-                            null_count += 1
-                            logger.debug(f"  Found 'PM Name' field but display_value is null/empty (skipping, {null_count} null values encountered so far)")
-                            continue
-                        
-                        # display_value is not null - use it as project manager's first name
-                        pm_name = str(display_value).strip()
-                        logger.info(f"  Found PM Name from custom field: {pm_name} (skipped {null_count} null values)")
-                        break
-                elif hasattr(field, 'name') and field.name and field.name.lower() == 'pm name':
-                    # Handle object with attributes
-                    display_value = getattr(field, 'display_value', None)
+                    else:
+                        display_value = getattr(field, 'display_value', None)
                     
                     # Check if display_value is null or empty
                     if display_value is None or (isinstance(display_value, str) and not display_value.strip()):
@@ -138,10 +143,17 @@ def transform_data(asana_data: Dict, summary: MigrationSummary, seen_tasks_track
                         logger.info(f"  Found PM Name from custom field: {pm_name} (skipped {null_count} null values)")
                         break
             
-            # If we found a PM name, we can stop searching
-            if pm_name:
+            if pm_name and len(company_names) > 1:
                 break
         
+        # If all tasks have the same company name, use it
+        if len(company_names) == 1:
+            company_name = next(iter(company_names))
+            logger.info(f"  Found company name from task custom field: {company_name}")
+        else: 
+            company_name = project_name
+            logger.info(f"  Company name is set as a project name!")
+        
         if not pm_name:
             logger.warning(f"  ⚠ No 'PM Name' custom field found with non-null display_value in any task")
             logger.warning(f"  ⚠ Project will be created without a manager assigned")
@@ -246,7 +258,9 @@ def transform_data(asana_data: Dict, summary: MigrationSummary, seen_tasks_track
         # Map Asana "Project Overview" (stored in 'notes' field) to Scoro project description/details field
         project_overview = project.get('overview') or project.get('notes') or project.get('description')
         if project_overview:
-            project_description = re.sub(r'<[^>]+>', '', str(project_overview))
+            project_description = str(project_overview)
+            if '<' in project_description:
+                project_description = _HTML_TAG_RE.sub('', project_description)
             # Convert newlines to HTML line breaks for Scoro API
             project_description = project_description.replace('\n', '<br>')
             transformed_project['description'] = project_description
@@ -254,14 +268,14 @@ def transform_data(asana_data: Dict, summary: MigrationSummary, seen_tasks_track
         # Map dates to Scoro API format (date field for start, deadline for due)
         if project.get('start_on') or project.get('created_at'):
             start_date = project.get('start_on') or project.get('created_at')
-            if isinstance(start_date, str) and 'T' in start_date:
-                start_date = start_date.split('T')[0]
+            if isinstance(start_date, str):
+                start_date = start_date.partition('T')[0]  # Date part only (unchanged if there is no time)
             transformed_project['date'] = start_date  # Scoro API uses 'date' for project start/creation date
         
         if project.get('due_date') or project.get('due_on'):
             due_date = project.get('due_date') or project.get('due_on')
-            if isinstance(due_date, str) and 'T' in due_date:
-                due_date = due_date.split('T')[0]
+            if isinstance(due_date, str):
+                due_date = due_date.partition('T')[0]
             transformed_project['deadline'] = due_date  # Scoro API uses 'deadline' not 'due_date'
         
         # Note: Scoro API doesn't have 'completed_date' field for projects
@@ -303,6 +317,7 @@ def transform_data(asana_data: Dict, summary: MigrationSummary, seen_tasks_track
         milestones_to_transform = asana_data.get('milestones', [])
         if milestones_to_transform:
             logger.info(f"Transforming {len(milestones_to_transform)} milestones...")
+            append_milestone = transformed_data['milestones'].append
             for milestone in milestones_to_transform:
                 milestone_name = milestone.get('name', 'Unknown')
                 milestone_due = milestone.get('due_on') or milestone.get('due_at')
@@ -314,17 +329,19 @@ def transform_data(asana_data: Dict, summary: MigrationSummary, seen_tasks_track
                 }
                 
                 if milestone_due:
-                    if isinstance(milestone_due, str) and 'T' in milestone_due:
-                        milestone_due = milestone_due.split('T')[0]
+                    if isinstance(milestone_due, str):
+                        milestone_due = milestone_due.partition('T')[0]
                     transformed_milestone['due_date'] = milestone_due
                 
                 if milestone.get('notes'):
-                    milestone_description = re.sub(r'<[^>]+>', '', str(milestone.get('notes', '')))
+                    milestone_description = str(milestone.get('notes', ''))
+                    if '<' in milestone_description:
+                        milestone_description = _HTML_TAG_RE.sub('', milestone_description)
                     # Convert newlines to HTML line breaks for Scoro API
                     milestone_description = milestone_description.replace('\n', '<br>')
                     transformed_milestone['description'] = milestone_description
                 
-                transformed_data['milestones'].append(transformed_milestone)
+                append_milestone(transformed_milestone)
             logger.info(f"✓ Transformed {len(transformed_data['milestones'])} milestones")
         
         # Transform sections to phases
@@ -376,7 +393,8 @@ def transform_data(asana_data: Dict, summary: MigrationSummary, seen_tasks_track
         
         # Transform tasks
         tasks_to_transform = asana_data.get('tasks', [])
-        logger.info(f"Transforming {len(tasks_to_transform)} tasks...")
+        total_tasks = len(tasks_to_transform)
+        logger.info(f"Transforming {total_tasks} tasks...")
         
         tasks_written = 0
         tasks_excluded = 0
@@ -384,22 +402,27 @@ def transform_data(asana_data: Dict, summary: MigrationSummary, seen_tasks_track
         tasks_replaced = 0
         filled_activity = 0
         filled_phase = 0
+        # Bound once for the task and subtask appends below
+        append_task = transformed_data['tasks'].append
         
         for idx, task in enumerate(tasks_to_transform, 1):
-            task_name = task.get('name', 'Unknown')
-            task_gid = task.get('gid', '')
+            task_get = task.get  # Bound once: the fields below are read with ~30 lookups per task
+            task_name = task_get('name', 'Unknown')
+            task_gid = task_get('gid', '')
             
-            logger.info(f"  [{idx}/{len(tasks_to_transform)}] Transforming task: {task_name}")
-            print(f"  [{idx}/{len(tasks_to_transform)}] Transforming task: {task_name}")
+            # Progress is reported every TRANSFORM_PROGRESS_INTERVAL tasks rather than for each one
+            if idx % TRANSFORM_PROGRESS_INTERVAL == 0 or idx == total_tasks:
+                logger.info(f"  [{idx}/{total_tasks}] Transforming task: {task_name}")
+                print(f"  [{idx}/{total_tasks}] Transforming task: {task_name}")
             
             # Extract basic task data
-            title = task.get('name', '').strip()
+            title = task_get('name', '').strip()
             if not title:
                 continue
             
-            # Deduplication logic: Check if task already exists
-            if task_gid and task_gid in task_tracker:
-                existing_task_info = task_tracker[task_gid]
+            # Deduplication logic: Check if task already exists (one lookup for the check and the entry)
+            existing_task_info = task_tracker.get(task_gid) if task_gid else None
+            if existing_task_info is not None:
                 existing_project = existing_task_info.get('project_name', 'Unknown')
                 existing_is_client = existing_task_info.get('is_client_project', False)
                 
@@ -421,11 +444,20 @@ def transform_data(asana_data: Dict, summary: MigrationSummary, seen_tasks_track
                     continue
             
             # Get created date for July 1 rule
-            created_at = task.get('created_at', '')
-            created_date = None
-            if created_at and str(created_at).strip():
+            created_at = task_get('created_at', '')
+            created_at_str = str(created_at).strip() if created_at else ''
+            if not created_at_str:
+                is_before_cutoff = _UNKNOWN_CREATED_BEFORE_CUTOFF
+            elif _VALID_CREATED_AT_RE.fullmatch(created_at_str):
+                if len(created_at_str) == 10:
+                    # Date only ("2025-07-01") means midnight
+                    is_before_cutoff = f"{created_at_str}T00:00:00" < _CUTOFF_ISO
+                else:
+                    # Common Asana form ("2025-07-01T12:34:56.789Z"): the parse below drops the
+                    # timezone too, so comparing the date and time prefix gives the same answer
+                    is_before_cutoff = created_at_str[:19] < _CUTOFF_ISO
+            else:
                 try:
-                    created_at_str = str(created_at).strip()
                     # Parse ISO format date
                     if 'T' in created_at_str:
                         # Handle timezone indicators
@@ -438,19 +470,18 @@ def transform_data(asana_data: Dict, summary: MigrationSummary, seen_tasks_track
                             created_date = created_date.replace(tzinfo=None)
                     else:
                         # Date only format
-                        date_part = created_at_str.split()[0] if created_at_str.split() else created_at_str
+                        date_part = created_at_str.split(None, 1)[0]  # Already stripped and non-empty
                         created_date = datetime.strptime(date_part, '%Y-%m-%d')
+                    is_before_cutoff = created_date < CUTOFF_DATE
                 except Exception as e:
                     logger.debug(f"    Could not parse created_at: {created_at}, error: {e}")
-                    created_date = datetime(2020, 1, 1)
-            else:
-                created_date = datetime(2020, 1, 1)
+                    is_before_cutoff = _UNKNOWN_CREATED_BEFORE_CUTOFF
             
             # July 1 rule: exclude tasks created before cutoff if no assignee or due date
             # Extract assignee information - prefer name from users map if available
             assignee = None
             assignee_gid = None
-            assignee_obj = task.get('assignee')
+            assignee_obj = task_get('assignee')
             if assignee_obj:
                 # Get GID first
                 if isinstance(assignee_obj, dict):
@@ -463,7 +494,6 @@ def transform_data(asana_data: Dict, summary: MigrationSummary, seen_tasks_track
                     assignee = str(assignee_obj) if assignee_obj else None
                 
                 # If we have users map, try to get name from there (more reliable)
-                users_map = asana_data.get('users', {})
                 if assignee_gid and assignee_gid in users_map:
                     user_details = users_map[assignee_gid]
                     assignee = user_details.get('name', assignee)
@@ -476,7 +506,7 @@ def transform_data(asana_data: Dict, summary: MigrationSummary, seen_tasks_track
                     assignee = str(assignee).strip()
             
             # Get due date - Scoro API uses datetime_due (ISO8601 format)
-            datetime_due = task.get('due_on') or task.get('due_at')
+            datetime_due = task_get('due_on') or task_get('due_at')
             if datetime_due:
                 if isinstance(datetime_due, str):
                     try:
@@ -494,7 +524,7 @@ def transform_data(asana_data: Dict, summary: MigrationSummary, seen_tasks_track
                 datetime_due = None
             
             # July 1 rule: exclude tasks created before cutoff if no assignee or due date
-            if created_date < CUTOFF_DATE:
+            if is_before_cutoff:
                 if not assignee or not datetime_due:
                     tasks_excluded += 1
                     logger.debug(f"    ⚠ Excluded task (July 1 rule): {task_name}")
@@ -502,13 +532,15 @@ def transform_data(asana_data: Dict, summary: MigrationSummary, seen_tasks_track
             
             # Extract custom fields (PM Name, Category, etc.)
             # Note: Time Task Tracking field has been eliminated - only Activity Types are used
-            pm_name = extract_custom_field_value(task, 'PM Name') or extract_custom_field_value(task, 'PM')
-            category = extract_custom_field_value(task, 'Category') or extract_custom_field_value(task, 'Activity Type')
+            # Custom field names are lowercased once here and shared by every lookup below
+            custom_fields = index_custom_fields(task)
+            pm_name = extract_custom_field_value(task, 'PM Name', custom_fields) or extract_custom_field_value(task, 'PM', custom_fields)
+            category = extract_custom_field_value(task, 'Category', custom_fields) or extract_custom_field_value(task, 'Activity Type', custom_fields)
             
             # Get section from assigned section (set during export when fetching tasks per section)
             # This is the primary and reliable method: section was assigned when task was fetched from section
-            section = task.get('_assigned_section_name')
-            section_gid = task.get('_assigned_section_gid')
+            section = task_get('_assigned_section_name')
+            section_gid = task_get('_assigned_section_gid')
             
             if section:
                 logger.debug(f"    Task has assigned section: '{section}' (GID: {section_gid})")
@@ -533,16 +565,16 @@ def transform_data(asana_data: Dict, summary: MigrationSummary, seen_tasks_track
                 if section_trimmed.lower() in ['untitled section', 'untitled']:
                     filled_phase += 1
                     project_phase = 'Misc'
-                    logger.info(f"    Task from section '{section}' (GID: {section_gid}) → mapped to 'Misc' phase (untitled section)")
+                    logger.debug(f"    Task from section '{section}' (GID: {section_gid}) → mapped to 'Misc' phase (untitled section)")
                 else:
                     # Use section name directly - this matches the phase name created from the section
                     project_phase = section_trimmed
-                    logger.info(f"    Task from section '{section}' (GID: {section_gid}) → assigned to phase: '{project_phase}'")
+                    logger.debug(f"    Task from section '{section}' (GID: {section_gid}) → assigned to phase: '{project_phase}'")
             else:
                 # Assign to "Misc" phase if no section (task was not in any section in Asana)
                 filled_phase += 1
                 project_phase = 'Misc'
-                logger.info(f"    Task has no section → assigned to 'Misc' phase")
+                logger.debug(f"    Task has no section → assigned to 'Misc' phase")
             
             # Map users
             # Note: Project Manager (PM Name) is already handled at project level via manager_id
@@ -553,7 +585,7 @@ def transform_data(asana_data: Dict, summary: MigrationSummary, seen_tasks_track
             # Extract created_by information - prefer name from users map if available
             created_by_name = None
             created_by_gid = None
-            created_by_obj = task.get('created_by')
+            created_by_obj = task_get('created_by')
             if created_by_obj:
                 # Get GID first
                 if isinstance(created_by_obj, dict):
@@ -566,7 +598,6 @@ def transform_data(asana_data: Dict, summary: MigrationSummary, seen_tasks_track
                     created_by_name = str(created_by_obj) if created_by_obj else None
                 
                 # If we have users map, try to get name from there (more reliable)
-                users_map = asana_data.get('users', {})
                 if created_by_gid and created_by_gid in users_map:
                     user_details = users_map[created_by_gid]
                     created_by_name = user_details.get('name', created_by_name)
@@ -595,13 +626,14 @@ def transform_data(asana_data: Dict, summary: MigrationSummary, seen_tasks_track
             # NOTE: Must extract this BEFORE setting completion status because Scoro requires
             # completed tasks to have time entries
             # Asana stores time as number_value in minutes, convert to HH:ii:ss format
-            estimated_time = extract_time_field_value(task, 'Estimated time') or extract_time_field_value(task, 'Estimated Time')
+            # (field names are matched case-insensitively, so one lookup covers 'Estimated Time' too)
+            estimated_time = extract_time_field_value(task, 'Estimated time', custom_fields)
             
             # Extract actual time from time tracking entries (preferred) or custom fields
             # IMPORTANT: Use Asana Time Tracking Entries API data for accurate actual time
-            completed = task.get('completed', False)
-            completed_at = task.get('completed_at')
-            time_tracking_entries = task.get('time_tracking_entries', [])
+            completed = task_get('completed', False)
+            completed_at = task_get('completed_at')
+            time_tracking_entries = task_get('time_tracking_entries', [])
             
             # Process time tracking entries from Asana API
             calculated_time_entries = []
@@ -628,7 +660,7 @@ def transform_data(asana_data: Dict, summary: MigrationSummary, seen_tasks_track
                                 else:
                                     end_dt = datetime.fromisoformat(end_datetime_str)
                             else:
-                                end_dt = datetime.strptime(end_datetime_str.split()[0], '%Y-%m-%d')
+                                end_dt = datetime.strptime(end_datetime_str.split(None, 1)[0], '%Y-%m-%d')
                             
                             # Calculate start_datetime from end_datetime - duration
                             start_dt = end_dt - timedelta(minutes=int(duration_minutes))
@@ -671,9 +703,9 @@ def transform_data(asana_data: Dict, summary: MigrationSummary, seen_tasks_track
             
             # Fallback: Extract from custom fields or task-level actual_time_minutes if no tracking entries
             if not actual_time:
-                actual_time = extract_time_field_value(task, 'Actual time') or extract_time_field_value(task, 'Actual Time')
-                if not actual_time and task.get('actual_time_minutes') is not None:
-                    actual_time = convert_minutes_to_hhmmss(task.get('actual_time_minutes'))
+                actual_time = extract_time_field_value(task, 'Actual time', custom_fields)
+                if not actual_time and task_get('actual_time_minutes') is not None:
+                    actual_time = convert_minutes_to_hhmmss(task_get('actual_time_minutes'))
             
             # has_actual_time is True if we have actual_time value OR we have time tracking entries
             has_actual_time = (actual_time and str(actual_time).strip()) or len(calculated_time_entries) > 0
@@ -711,7 +743,7 @@ def transform_data(asana_data: Dict, summary: MigrationSummary, seen_tasks_track
                                 completion_dt = datetime.fromisoformat(completed_at.replace('Z', '+00:00'))
                             else:
                                 # Date only, use completion date at 00:00:00
-                                completion_dt = datetime.strptime(completed_at.split()[0], '%Y-%m-%d')
+                                completion_dt = datetime.strptime(completed_at.split(None, 1)[0], '%Y-%m-%d')
                         else:
                             completion_dt = completed_at
                     except Exception as e:
@@ -720,14 +752,14 @@ def transform_data(asana_data: Dict, summary: MigrationSummary, seen_tasks_track
                 
                 # Fallback to modified_at if completed_at is not available
                 if completion_dt is None:
-                    modified_at = task.get('modified_at')
+                    modified_at = task_get('modified_at')
                     if modified_at:
                         try:
                             if isinstance(modified_at, str):
                                 if 'T' in modified_at:
                                     completion_dt = datetime.fromisoformat(modified_at.replace('Z', '+00:00'))
                                 else:
-                                    completion_dt = datetime.strptime(modified_at.split()[0], '%Y-%m-%d')
+                                    completion_dt = datetime.strptime(modified_at.split(None, 1)[0], '%Y-%m-%d')
                             else:
                                 completion_dt = modified_at
                             logger.debug(f"    Using modified_at as fallback for completed_at: {modified_at}")
@@ -737,14 +769,14 @@ def transform_data(asana_data: Dict, summary: MigrationSummary, seen_tasks_track
                 
                 # Final fallback to created_at if both completed_at and modified_at are unavailable
                 if completion_dt is None:
-                    created_at = task.get('created_at')
+                    created_at = task_get('created_at')
                     if created_at:
                         try:
                             if isinstance(created_at, str):
                                 if 'T' in created_at:
                                     completion_dt = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
                                 else:
-                                    completion_dt = datetime.strptime(created_at.split()[0], '%Y-%m-%d')
+                                    completion_dt = datetime.strptime(created_at.split(None, 1)[0], '%Y-%m-%d')
                             else:
                                 completion_dt = created_at
                             logger.debug(f"    Using created_at as fallback for completed_at: {created_at}")
@@ -796,7 +828,7 @@ def transform_data(asana_data: Dict, summary: MigrationSummary, seen_tasks_track
                 logger.debug(f"    Task will be marked as in progress (task_status3) after time entry creation")
             
             # Get start date - Scoro API uses start_datetime (ISO8601 format)
-            start_datetime = task.get('start_on') or task.get('start_at')
+            start_datetime = task_get('start_on') or task_get('start_at')
             if start_datetime:
                 if isinstance(start_datetime, str):
                     try:
@@ -814,12 +846,13 @@ def transform_data(asana_data: Dict, summary: MigrationSummary, seen_tasks_track
             
             # Map Asana task overview/description (stored in 'notes' or 'html_notes' field) to Scoro task "Description" field
             # At task level: Overview goes to "Description" field
-            description = task.get('notes', '')
+            description = task_get('notes', '')
             if description:
                 description = str(description).strip()
                 if description:
-                    # Clean HTML if present
-                    description = re.sub(r'<[^>]+>', '', description)
+                    # Clean HTML if present (most notes are plain text, so skip the regex then)
+                    if '<' in description:
+                        description = _HTML_TAG_RE.sub('', description)
                     # Convert newlines to HTML line breaks for Scoro API
                     # Scoro expects HTML formatting for line breaks in descriptions
                     description = description.replace('\n', '<br>')
@@ -830,38 +863,30 @@ def transform_data(asana_data: Dict, summary: MigrationSummary, seen_tasks_track
             
             # Extract stories/comments for separate processing (not mixed with description)
             # Comments will be created separately via Scoro Comments API
-            stories = task.get('stories', [])
+            stories = task_get('stories', [])
             
             company = None
             # Get company name (from custom field or project)
-            company = extract_custom_field_value(task, 'C-Name') or extract_custom_field_value(task, 'Company Name')
+            company = extract_custom_field_value(task, 'C-Name', custom_fields) or extract_custom_field_value(task, 'Company Name', custom_fields)
             # Fallback to project-level company name if task doesn't have its own company
             if not company:
                 company = company_name
             if company is not None:
-                logger.info(f"Task's company name is {company}")
+                logger.debug(f"Task's company name is {company}")
             else:
-                logger.info(f"Task Related Company ID: None")
+                logger.debug(f"Task Related Company ID: None")
             
             # Extract tags
             tags = extract_tags(task)
             
             # Extract priority and convert to priority_id
             # Scoro API: priority_id Integer - 1=high, 2=normal, 3=low
-            priority_str = extract_priority(task, title)
-            priority_id = None
-            if priority_str:
-                priority_lower = priority_str.lower()
-                if 'high' in priority_lower:
-                    priority_id = 1
-                elif 'low' in priority_lower:
-                    priority_id = 3
-                else:
-                    priority_id = 2  # Default to normal/medium
+            priority_str = extract_priority(task, title, custom_fields)
+            priority_id = _PRIORITY_IDS.get(priority_str, 2) if priority_str else None  # Default to normal/medium
             
             # Get dependencies (for reference, may need to be handled separately in Scoro)
-            dependencies = task.get('dependencies', [])
-            dependents = task.get('dependents', [])
+            dependencies = task_get('dependencies', [])
+            dependents = task_get('dependents', [])
             dependency_gids = []
             if dependencies:
                 for dep in dependencies:
@@ -873,11 +898,11 @@ def transform_data(asana_data: Dict, summary: MigrationSummary, seen_tasks_track
                         dependency_gids.append(dep_gid)
             
             # Get subtasks count
-            subtasks = task.get('subtasks', [])
-            num_subtasks = len(subtasks) if subtasks else task.get('num_subtasks', 0)
+            subtasks = task_get('subtasks', [])
+            num_subtasks = len(subtasks) if subtasks else task_get('num_subtasks', 0)
             
             # Get attachments count and references
-            attachments = task.get('attachments', [])
+            attachments = task_get('attachments', [])
             attachment_count = len(attachments) if attachments else 0
             attachment_refs = []
             if attachments:
@@ -889,13 +914,12 @@ def transform_data(asana_data: Dict, summary: MigrationSummary, seen_tasks_track
                             attachment_refs.append(f"{att_name} ({att_url})" if att_name and att_url else (att_name or att_url))
             
             # Check if this is a milestone
-            resource_subtype = task.get('resource_subtype', '')
+            resource_subtype = task_get('resource_subtype', '')
             is_milestone = resource_subtype == 'milestone'
             
             # Get followers - extract names from users map if available
-            followers = task.get('followers', [])
+            followers = task_get('followers', [])
             follower_names = []
-            users_map = asana_data.get('users', {})
             if followers:
                 for follower in followers:
                     follower_name = None
@@ -919,120 +943,98 @@ def transform_data(asana_data: Dict, summary: MigrationSummary, seen_tasks_track
                         follower_names.append(str(follower_name).strip())
             
             # Get permalink for reference
-            permalink = task.get('permalink_url', '')
+            permalink = task_get('permalink_url', '')
             
             # Build comprehensive Scoro task data structure matching Scoro API format
             # Reference: Scoro API Reference.md - Tasks API fields
+            # All fields are collected in one literal; optional fields without a value are dropped below
+            assigned_user = validate_user(assignee, default_to_tom=False)
             transformed_task = {
                 'title': title,  # Will be mapped to 'event_name' in importer
                 'is_completed': is_completed,  # Scoro API uses Boolean 'is_completed'
                 'is_personal': False,  # Scoro API uses Boolean 'is_personal', default to False (not personal)
-            }
-            
-            # Add optional fields only if they have values, matching Scoro API field names
-            if description:
-                transformed_task['description'] = description
-            if start_datetime:
-                transformed_task['start_datetime'] = start_datetime  # Scoro API uses 'start_datetime' (ISO8601)
-            if datetime_due:
-                transformed_task['datetime_due'] = datetime_due  # Scoro API uses 'datetime_due' (ISO8601)
-            if estimated_time:
-                transformed_task['duration_planned'] = estimated_time  # Scoro API uses 'duration_planned' (Time HH:ii:ss)
+                
+                # Optional fields, matching Scoro API field names
+                'description': description,
+                'start_datetime': start_datetime,  # Scoro API uses 'start_datetime' (ISO8601)
+                'datetime_due': datetime_due,  # Scoro API uses 'datetime_due' (ISO8601)
+                'duration_planned': estimated_time,  # Scoro API uses 'duration_planned' (Time HH:ii:ss)
                 # Set billable_time_type to 'billable' so billable_hours equals duration_planned
-                transformed_task['billable_time_type'] = 'billable'  # Scoro API: 'billable' sets billable_hours = duration_planned
-            if actual_time:
-                transformed_task['duration_actual'] = actual_time  # Scoro API uses 'duration_actual' (Time HH:ii:ss)
-            if activity_type:
-                transformed_task['activity_type'] = activity_type  # Scoro API uses 'activity_type' (String)
-            if status:
-                transformed_task['status'] = status  # Scoro API uses 'status' (task_status1-4)
-            if datetime_completed:
-                transformed_task['datetime_completed'] = datetime_completed  # Scoro API uses 'datetime_completed' (ISO8601)
-            if priority_id:
-                transformed_task['priority_id'] = priority_id  # Scoro API uses 'priority_id' (Integer: 1=high, 2=normal, 3=low)
+                'billable_time_type': 'billable' if estimated_time else None,  # Scoro API: 'billable' sets billable_hours = duration_planned
+                'duration_actual': actual_time,  # Scoro API uses 'duration_actual' (Time HH:ii:ss)
+                'activity_type': activity_type,  # Scoro API uses 'activity_type' (String)
+                'status': status,  # Scoro API uses 'status' (task_status1-4)
+                'datetime_completed': datetime_completed,  # Scoro API uses 'datetime_completed' (ISO8601)
+                'priority_id': priority_id,  # Scoro API uses 'priority_id' (Integer: 1=high, 2=normal, 3=low)
+                
+                # owner_id - the person responsible for THIS specific task
+                # According to Scoro API: owner_id is "User ID of the user that is responsible for the event"
+                # This should be the task creator (created_by) if available, otherwise the task assignee
+                # NOT the project manager
+                'owner_name': task_owner,  # Store name, importer will resolve to owner_id
+                
+                # related_users - ONLY the primary assignee should be in related_users
+                # According to Scoro API: related_users is "Array of user IDs that the task is assigned to"
+                # This should contain ONLY the assignee, NOT followers/collaborators
+                # Followers/collaborators are NOT supported as assignees in Scoro
+                # Note: related_users is always the assignee, even if owner_id comes from created_by
+                'assigned_to_name': [assigned_user] if assigned_user else None,  # Store as list, importer will resolve to related_users array
+                
+                'project_name': project_name,  # Store name, importer will resolve to project_id
+                'project_phase_name': project_phase,  # Store name, importer will resolve to project_phase_id
+                'company_name': company,  # Store name, importer will resolve to company_id
+                
+                # Additional Scoro API fields that may be populated later or left empty
+                # These fields are available in Scoro API but may not be available from Asana:
+                # activity_id (Integer), quote_line_id (Integer), invoice_id (Integer),
+                # order_id (Integer), purchase_order_id (Integer), rent_order_id (Integer),
+                # bill_id (Integer), billable_hours (Time), billable_time_type (String),
+                # created_user (Integer), modified_user (Integer), owner_email (String),
+                # custom_fields (Object), tags (Array), permissions (Array)
+                
+                # Metadata fields for internal use (not sent to API but useful for tracking)
+                # These fields are excluded in the importer before sending to Scoro API
+                'tags': tags,  # Stored for reference, excluded from API request
+                'dependencies': dependency_gids,  # May need special handling
+                'num_subtasks': num_subtasks,
+                'attachment_count': attachment_count,
+                'attachment_refs': attachment_refs,
+                'is_milestone': is_milestone,
+                'followers': follower_names,
+                'asana_permalink': permalink,  # Keep reference to original
+                'asana_gid': task_gid,  # Asana GID for reference and deduplication
+                
+                # Stories/comments for separate comment creation via Scoro Comments API
+                'stories': stories,
+                
+                # Calculated time entries for completed tasks without time entries
+                # These will be created via Scoro Time Entries API after the task is created
+                'calculated_time_entries': calculated_time_entries,
+                
+                # Completion info for status update in importer
+                # These fields help the importer determine the final status after time entries are created
+                '_asana_completed': completed,
+                '_asana_completed_at': completed_at,
+                '_has_calculated_time_entries': has_calculated_time_entries,
+            }
+            transformed_task = {key: value for key, value in transformed_task.items()
+                                if value or key in _TASK_FIELDS_ALWAYS_KEPT}
             
-            # Set owner_id - the person responsible for THIS specific task
-            # According to Scoro API: owner_id is "User ID of the user that is responsible for the event"
-            # This should be the task creator (created_by) if available, otherwise the task assignee
-            # NOT the project manager
             if task_owner:
-                transformed_task['owner_name'] = task_owner  # Store name, importer will resolve to owner_id
                 logger.debug(f"    Task owner (owner_id): {task_owner}")
-            
-            # Set related_users - ONLY the primary assignee should be in related_users
-            # According to Scoro API: related_users is "Array of user IDs that the task is assigned to"
-            # This should contain ONLY the assignee, NOT followers/collaborators
-            # Followers/collaborators are NOT supported as assignees in Scoro
-            # Note: related_users is always the assignee, even if owner_id comes from created_by
-            assigned_user = validate_user(assignee, default_to_tom=False)
             if assigned_user:
-                # Only the primary assignee goes into related_users
-                transformed_task['assigned_to_name'] = [assigned_user]  # Store as list, importer will resolve to related_users array
                 logger.debug(f"    Task related_users (assignee only): {assigned_user}")
-            
             # Note: Followers/collaborators from Asana are NOT migrated to Scoro
             # Scoro's related_users field is for assignees only, not followers
             if follower_names:
                 logger.debug(f"    Task followers (not migrated to Scoro): {follower_names}")
-            
             # Log project manager for reference (already set at project level)
             if pm_for_reference:
                 logger.debug(f"    Project manager (set at project level): {pm_for_reference}")
-            if project_name:
-                transformed_task['project_name'] = project_name  # Store name, importer will resolve to project_id
-            if project_phase:
-                transformed_task['project_phase_name'] = project_phase  # Store name, importer will resolve to project_phase_id
-            if company:
-                transformed_task['company_name'] = company  # Store name, importer will resolve to company_id
-            
-            # Additional Scoro API fields that may be populated later or left empty
-            # These fields are available in Scoro API but may not be available from Asana:
-            # activity_id (Integer), quote_line_id (Integer), invoice_id (Integer),
-            # order_id (Integer), purchase_order_id (Integer), rent_order_id (Integer),
-            # bill_id (Integer), billable_hours (Time), billable_time_type (String),
-            # created_user (Integer), modified_user (Integer), owner_email (String),
-            # custom_fields (Object), tags (Array), permissions (Array)
-            
-            # Metadata fields for internal use (not sent to API but useful for tracking)
-            # These fields are excluded in the importer before sending to Scoro API
-            if tags:
-                transformed_task['tags'] = tags  # Stored for reference, excluded from API request
-            if dependency_gids:
-                transformed_task['dependencies'] = dependency_gids  # May need special handling
-            if num_subtasks > 0:
-                transformed_task['num_subtasks'] = num_subtasks
-            if attachment_count > 0:
-                transformed_task['attachment_count'] = attachment_count
-                if attachment_refs:
-                    transformed_task['attachment_refs'] = attachment_refs
-            if is_milestone:
-                transformed_task['is_milestone'] = True
-            if follower_names:
-                transformed_task['followers'] = follower_names
-            if permalink:
-                transformed_task['asana_permalink'] = permalink  # Keep reference to original
-            
-            # Store Asana GID for reference and deduplication
-            if task_gid:
-                transformed_task['asana_gid'] = task_gid
-            
-            # Store stories/comments for separate comment creation via Scoro Comments API
-            if stories:
-                transformed_task['stories'] = stories
-            
-            # Store calculated time entry for completed tasks without time entries
-            # This will be created via Scoro Time Entries API after the task is created
             if calculated_time_entries:
-                transformed_task['calculated_time_entries'] = calculated_time_entries
                 logger.debug(f"    Added {len(calculated_time_entries)} calculated time entries to task")
             
-            # Store completion info for status update in importer
-            # These fields help the importer determine the final status after time entries are created
-            transformed_task['_asana_completed'] = completed
-            transformed_task['_asana_completed_at'] = completed_at
-            transformed_task['_has_calculated_time_entries'] = has_calculated_time_entries
-            
-            transformed_data['tasks'].append(transformed_task)
+            append_task(transformed_task)
             tasks_written += 1
             
             # Track this task for deduplication
@@ -1047,19 +1049,21 @@ def transform_data(asana_data: Dict, summary: MigrationSummary, seen_tasks_track
             
             # Process subtasks as separate tasks
             # Subtasks will be created with parent_id linking to the parent task in Scoro
-            if subtasks and len(subtasks) > 0:
-                logger.info(f"    Processing {len(subtasks)} subtask(s) for task: {task_name}")
+            # (num_subtasks is the length of a non-empty subtasks list, so it is reused below)
+            if subtasks:
+                logger.info(f"    Processing {num_subtasks} subtask(s) for task: {task_name}")
                 for subtask_idx, subtask in enumerate(subtasks, 1):
                     try:
-                        subtask_gid = subtask.get('gid', '')
-                        subtask_name = subtask.get('name', 'Unknown')
-                        logger.debug(f"      [{subtask_idx}/{len(subtasks)}] Transforming subtask: {subtask_name}")
+                        subtask_get = subtask.get
+                        subtask_gid = subtask_get('gid', '')
+                        subtask_name = subtask_get('name', 'Unknown')
+                        logger.debug(f"      [{subtask_idx}/{num_subtasks}] Transforming subtask: {subtask_name}")
                         
                         # Transform subtask using similar logic to parent task
                         # Subtasks inherit: project_name, project_phase, company from parent
                         # But have their own: title, description, assignee, due date, etc.
                         
-                        subtask_title = subtask.get('name', '').strip()
+                        subtask_title = subtask_get('name', '').strip()
                         if not subtask_title:
                             logger.warning(f"      ⚠ Skipping subtask with no name (GID: {subtask_gid})")
                             continue
@@ -1067,7 +1071,7 @@ def transform_data(asana_data: Dict, summary: MigrationSummary, seen_tasks_track
                         # Get subtask assignee
                         subtask_assignee = None
                         subtask_assignee_gid = None
-                        subtask_assignee_obj = subtask.get('assignee')
+                        subtask_assignee_obj = subtask_get('assignee')
                         if subtask_assignee_obj:
                             if isinstance(subtask_assignee_obj, dict):
                                 subtask_assignee_gid = subtask_assignee_obj.get('gid')
@@ -1079,7 +1083,6 @@ def transform_data(asana_data: Dict, summary: MigrationSummary, seen_tasks_track
                                 subtask_assignee = str(subtask_assignee_obj) if subtask_assignee_obj else None
                             
                             # If we have users map, try to get name from there
-                            users_map = asana_data.get('users', {})
                             if subtask_assignee_gid and subtask_assignee_gid in users_map:
                                 user_details = users_map[subtask_assignee_gid]
                                 subtask_assignee = user_details.get('name', subtask_assignee)
@@ -1090,7 +1093,7 @@ def transform_data(asana_data: Dict, summary: MigrationSummary, seen_tasks_track
                                 subtask_assignee = str(subtask_assignee).strip()
                         
                         # Get subtask due date
-                        subtask_datetime_due = subtask.get('due_on') or subtask.get('due_at')
+                        subtask_datetime_due = subtask_get('due_on') or subtask_get('due_at')
                         if subtask_datetime_due:
                             if isinstance(subtask_datetime_due, str):
                                 try:
@@ -1107,7 +1110,7 @@ def transform_data(asana_data: Dict, summary: MigrationSummary, seen_tasks_track
                         # Get subtask created_by for owner_id
                         subtask_created_by_name = None
                         subtask_created_by_gid = None
-                        subtask_created_by_obj = subtask.get('created_by')
+                        subtask_created_by_obj = subtask_get('created_by')
                         if subtask_created_by_obj:
                             if isinstance(subtask_created_by_obj, dict):
                                 subtask_created_by_gid = subtask_created_by_obj.get('gid')
@@ -1118,7 +1121,6 @@ def transform_data(asana_data: Dict, summary: MigrationSummary, seen_tasks_track
                             else:
                                 subtask_created_by_name = str(subtask_created_by_obj) if subtask_created_by_obj else None
                             
-                            users_map = asana_data.get('users', {})
                             if subtask_created_by_gid and subtask_created_by_gid in users_map:
                                 user_details = users_map[subtask_created_by_gid]
                                 subtask_created_by_name = user_details.get('name', subtask_created_by_name)
@@ -1135,11 +1137,12 @@ def transform_data(asana_data: Dict, summary: MigrationSummary, seen_tasks_track
                             subtask_owner = validate_user(subtask_assignee, default_to_tom=False)
                         
                         # Get subtask description
-                        subtask_description = subtask.get('notes', '')
+                        subtask_description = subtask_get('notes', '')
                         if subtask_description:
                             subtask_description = str(subtask_description).strip()
                             if subtask_description:
-                                subtask_description = re.sub(r'<[^>]+>', '', subtask_description)
+                                if '<' in subtask_description:
+                                    subtask_description = _HTML_TAG_RE.sub('', subtask_description)
                                 subtask_description = subtask_description.replace('\n', '<br>')
                             else:
                                 subtask_description = None
@@ -1147,11 +1150,11 @@ def transform_data(asana_data: Dict, summary: MigrationSummary, seen_tasks_track
                             subtask_description = None
                         
                         # Get subtask completion status
-                        subtask_completed = subtask.get('completed', False)
-                        subtask_completed_at = subtask.get('completed_at')
+                        subtask_completed = subtask_get('completed', False)
+                        subtask_completed_at = subtask_get('completed_at')
                         
                         # Get subtask time tracking entries
-                        subtask_time_tracking_entries = subtask.get('time_tracking_entries', [])
+                        subtask_time_tracking_entries = subtask_get('time_tracking_entries', [])
                         subtask_calculated_time_entries = []
                         subtask_total_duration_minutes = 0
                         subtask_actual_time = None
@@ -1173,7 +1176,7 @@ def transform_data(asana_data: Dict, summary: MigrationSummary, seen_tasks_track
                                             else:
                                                 end_dt = datetime.fromisoformat(end_datetime_str)
                                         else:
-                                            end_dt = datetime.strptime(end_datetime_str.split()[0], '%Y-%m-%d')
+                                            end_dt = datetime.strptime(end_datetime_str.split(None, 1)[0], '%Y-%m-%d')
                                         
                                         start_dt = end_dt - timedelta(minutes=int(duration_minutes))
                                         start_datetime_str = start_dt.isoformat()
@@ -1216,7 +1219,7 @@ def transform_data(asana_data: Dict, summary: MigrationSummary, seen_tasks_track
                                         if 'T' in subtask_completed_at:
                                             completion_dt = datetime.fromisoformat(subtask_completed_at.replace('Z', '+00:00'))
                                         else:
-                                            completion_dt = datetime.strptime(subtask_completed_at.split()[0], '%Y-%m-%d')
+                                            completion_dt = datetime.strptime(subtask_completed_at.split(None, 1)[0], '%Y-%m-%d')
                                     else:
                                         completion_dt = subtask_completed_at
                                 except Exception:
@@ -1247,7 +1250,7 @@ def transform_data(asana_data: Dict, summary: MigrationSummary, seen_tasks_track
                             subtask_has_calculated_time_entries = True
                         
                         # Get subtask start date
-                        subtask_start_datetime = subtask.get('start_on') or subtask.get('start_at')
+                        subtask_start_datetime = subtask_get('start_on') or subtask_get('start_at')
                         if subtask_start_datetime:
                             if isinstance(subtask_start_datetime, str):
                                 try:
@@ -1262,78 +1265,57 @@ def transform_data(asana_data: Dict, summary: MigrationSummary, seen_tasks_track
                         
                         # Get subtask priority
                         subtask_priority_str = extract_priority(subtask, subtask_title)
-                        subtask_priority_id = None
-                        if subtask_priority_str:
-                            priority_lower = subtask_priority_str.lower()
-                            if 'high' in priority_lower:
-                                subtask_priority_id = 1
-                            elif 'low' in priority_lower:
-                                subtask_priority_id = 3
-                            else:
-                                subtask_priority_id = 2
+                        subtask_priority_id = _PRIORITY_IDS.get(subtask_priority_str, 2) if subtask_priority_str else None
                         
                         # Get subtask stories/comments
-                        subtask_stories = subtask.get('stories', [])
+                        subtask_stories = subtask_get('stories', [])
                         
-                        # Build transformed subtask
+                        # Build transformed subtask; optional fields without a value are dropped below
+                        assigned_user = validate_user(subtask_assignee, default_to_tom=False)
                         transformed_subtask = {
                             'title': subtask_title,
                             'is_completed': False,  # Create as not completed initially
                             'is_personal': False,
+                            
+                            # Optional fields
+                            'description': subtask_description,
+                            'start_datetime': subtask_start_datetime,
+                            'datetime_due': subtask_datetime_due,
+                            'duration_actual': subtask_actual_time,
+                            'priority_id': subtask_priority_id,
+                            'status': status,
+                            
+                            # Inherit from parent: project_name, project_phase_name, company_name, activity_type
+                            'project_name': project_name,
+                            'project_phase_name': project_phase,
+                            'company_name': company,
+                            'activity_type': activity_type,
+                            
+                            # Set owner and assignee
+                            'owner_name': subtask_owner,
+                            'assigned_to_name': [assigned_user] if assigned_user else None,
+                            
+                            # Mark as subtask with parent reference
+                            'parent_asana_gid': task_gid,  # Link to parent via Asana GID
+                            'is_subtask': True,  # Flag to identify as subtask
+                            
+                            # Store Asana GID
+                            'asana_gid': subtask_gid,
+                            
+                            # Store stories and time entries
+                            'stories': subtask_stories,
+                            'calculated_time_entries': subtask_calculated_time_entries,
+                            
+                            # Store completion info
+                            '_asana_completed': subtask_completed,
+                            '_asana_completed_at': subtask_completed_at,
+                            '_has_calculated_time_entries': subtask_has_calculated_time_entries,
                         }
-                        
-                        # Add optional fields
-                        if subtask_description:
-                            transformed_subtask['description'] = subtask_description
-                        if subtask_start_datetime:
-                            transformed_subtask['start_datetime'] = subtask_start_datetime
-                        if subtask_datetime_due:
-                            transformed_subtask['datetime_due'] = subtask_datetime_due
-                        if subtask_actual_time:
-                            transformed_subtask['duration_actual'] = subtask_actual_time
-                        if subtask_priority_id:
-                            transformed_subtask['priority_id'] = subtask_priority_id
-                        if status:
-                            transformed_subtask['status'] = status
-                        
-                        # Inherit from parent: project_name, project_phase_name, company_name, activity_type
-                        if project_name:
-                            transformed_subtask['project_name'] = project_name
-                        if project_phase:
-                            transformed_subtask['project_phase_name'] = project_phase
-                        if company:
-                            transformed_subtask['company_name'] = company
-                        if activity_type:
-                            transformed_subtask['activity_type'] = activity_type
-                        
-                        # Set owner and assignee
-                        if subtask_owner:
-                            transformed_subtask['owner_name'] = subtask_owner
-                        assigned_user = validate_user(subtask_assignee, default_to_tom=False)
-                        if assigned_user:
-                            transformed_subtask['assigned_to_name'] = [assigned_user]
-                        
-                        # Mark as subtask with parent reference
-                        transformed_subtask['parent_asana_gid'] = task_gid  # Link to parent via Asana GID
-                        transformed_subtask['is_subtask'] = True  # Flag to identify as subtask
-                        
-                        # Store Asana GID
-                        if subtask_gid:
-                            transformed_subtask['asana_gid'] = subtask_gid
-                        
-                        # Store stories and time entries
-                        if subtask_stories:
-                            transformed_subtask['stories'] = subtask_stories
-                        if subtask_calculated_time_entries:
-                            transformed_subtask['calculated_time_entries'] = subtask_calculated_time_entries
-                        
-                        # Store completion info
-                        transformed_subtask['_asana_completed'] = subtask_completed
-                        transformed_subtask['_asana_completed_at'] = subtask_completed_at
-                        transformed_subtask['_has_calculated_time_entries'] = subtask_has_calculated_time_entries
+                        transformed_subtask = {key: value for key, value in transformed_subtask.items()
+                                               if value or key in _TASK_FIELDS_ALWAYS_KEPT}
                         
                         # Add subtask to tasks list
-                        transformed_data['tasks'].append(transformed_subtask)
+                        append_task(transformed_subtask)
                         tasks_written += 1
                         
                         logger.debug(f"      ✓ Subtask transformed: {subtask_name}")
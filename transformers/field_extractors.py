@@ -1,7 +1,7 @@
 """
 Field extraction utilities for Asana tasks
 """
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from utils import logger
 
 
@@ -29,46 +29,69 @@ def convert_minutes_to_hhmmss(minutes: int) -> str:
         return None
 
 
-def extract_custom_field_value(task: Dict, field_name: str) -> Optional[str]:
-    """Extract value from Asana custom fields"""
-    custom_fields = task.get('custom_fields', [])
-    if not custom_fields:
-        return None
+def index_custom_fields(task: Dict) -> List[Tuple[str, Any]]:
+    """
+    Pair each of a task's custom fields with its lowercased name
+    
+    The per-task index is built once and passed to the extract_* helpers, so looking up
+    several fields on the same task doesn't lowercase every field name again per lookup.
     
-    for field in custom_fields:
+    Args:
+        task: Asana task dictionary
+    
+    Returns:
+        List of (lowercased field name, field) tuples in Asana order
+    """
+    indexed = []
+    for field in task.get('custom_fields') or ():
         if isinstance(field, dict):
-            field_name_lower = field.get('name', '').lower()
-            if field_name.lower() in field_name_lower:
-                # Priority 1: Check display_value first (for enum fields, this is the displayed name)
-                if 'display_value' in field and field.get('display_value'):
-                    display_val = field.get('display_value')
-                    if display_val and str(display_val).strip():
-                        return str(display_val).strip()
-                
-                # Priority 2: Handle different field types
-                if 'text_value' in field:
-                    value = field.get('text_value')
-                    return str(value).strip() if value is not None and str(value).strip() else None
-                elif 'enum_value' in field and field['enum_value']:
-                    enum_val = field['enum_value']
-                    if isinstance(enum_val, dict):
-                        return enum_val.get('name')
-                    elif hasattr(enum_val, 'name'):
-                        return enum_val.name
-                    else:
-                        return str(enum_val) if enum_val else None
-                elif 'number_value' in field:
-                    value = field.get('number_value')
-                    return str(value) if value is not None else None
-                elif 'date_value' in field and field['date_value']:
-                    date_val = field['date_value']
-                    if isinstance(date_val, dict):
-                        return date_val.get('date')
-                    elif hasattr(date_val, 'date'):
-                        return date_val.date
-                    else:
-                        return str(date_val) if date_val else None
-        elif hasattr(field, 'name') and field_name.lower() in field.name.lower():
+            indexed.append((field.get('name', '').lower(), field))
+        elif hasattr(field, 'name'):
+            indexed.append((field.name.lower(), field))
+    return indexed
+
+
+def extract_custom_field_value(task: Dict, field_name: str,
+                               fields: Optional[List[Tuple[str, Any]]] = None) -> Optional[str]:
+    """Extract value from Asana custom fields (pass `fields` from index_custom_fields to reuse it)"""
+    if fields is None:
+        fields = index_custom_fields(task)
+    field_name = field_name.lower()
+    
+    for name_lower, field in fields:
+        if field_name not in name_lower:
+            continue
+        if isinstance(field, dict):
+            # Priority 1: Check display_value first (for enum fields, this is the displayed name)
+            if 'display_value' in field and field.get('display_value'):
+                display_val = field.get('display_value')
+                if display_val and str(display_val).strip():
+                    return str(display_val).strip()
+            
+            # Priority 2: Handle different field types
+            if 'text_value' in field:
+                value = field.get('text_value')
+                return str(value).strip() if value is not None and str(value).strip() else None
+            elif 'enum_value' in field and field['enum_value']:
+                enum_val = field['enum_value']
+                if isinstance(enum_val, dict):
+                    return enum_val.get('name')
+                elif hasattr(enum_val, 'name'):
+                    return enum_val.name
+                else:
+                    return str(enum_val) if enum_val else None
+            elif 'number_value' in field:
+                value = field.get('number_value')
+                return str(value) if value is not None else None
+            elif 'date_value' in field and field['date_value']:
+                date_val = field['date_value']
+                if isinstance(date_val, dict):
+                    return date_val.get('date')
+                elif hasattr(date_val, 'date'):
+                    return date_val.date
+                else:
+                    return str(date_val) if date_val else None
+        else:
             # Handle object with attributes
             if hasattr(field, 'display_value') and field.display_value:
                 return str(field.display_value).strip() if str(field.display_value).strip() else None
@@ -98,7 +121,7 @@ def extract_tags(task: Dict) -> List[str]:
     return tag_list
 
 
-def extract_priority(task: Dict, title: str) -> str:
+def extract_priority(task: Dict, title: str, fields: Optional[List[Tuple[str, Any]]] = None) -> str:
     """
     Extract or infer priority from task data
     
@@ -106,9 +129,11 @@ def extract_priority(task: Dict, title: str) -> str:
     - High: Tasks with "urgent", "asap", "high priority" in title or custom fields
     - Medium: Default for most tasks
     - Low: Tasks with "low priority" or "nice to have" indicators
+    
+    `fields` is an optional index_custom_fields(task) result to reuse.
     """
-    # Check custom fields first
-    priority_field = extract_custom_field_value(task, 'Priority') or extract_custom_field_value(task, 'priority')
+    # Check custom fields first (field names are matched case-insensitively)
+    priority_field = extract_custom_field_value(task, 'Priority', fields)
     if priority_field:
         priority_lower = str(priority_field).lower()
         if 'high' in priority_lower or 'urgent' in priority_lower:
@@ -159,7 +184,8 @@ def format_comments_for_description(stories: List[Dict]) -> str:
     return '\n\n'.join(comments) if comments else ''
 
 
-def extract_time_field_value(task: Dict, field_name: str) -> Optional[str]:
+def extract_time_field_value(task: Dict, field_name: str,
+                             fields: Optional[List[Tuple[str, Any]]] = None) -> Optional[str]:
     """
     Extract time field value from Asana task and convert to HH:ii:ss format.
     
@@ -169,30 +195,31 @@ def extract_time_field_value(task: Dict, field_name: str) -> Optional[str]:
     Args:
         task: Asana task dictionary
         field_name: Name of the time field (e.g., 'Estimated time', 'Actual time')
+        fields: Optional index_custom_fields(task) result to reuse
     
     Returns:
         Time string in HH:ii:ss format, or None if not found
     """
-    custom_fields = task.get('custom_fields', [])
-    if not custom_fields:
-        return None
+    if fields is None:
+        fields = index_custom_fields(task)
+    field_name = field_name.lower()
     
-    for field in custom_fields:
+    for name_lower, field in fields:
+        if field_name not in name_lower:
+            continue
         if isinstance(field, dict):
-            field_name_lower = field.get('name', '').lower()
-            if field_name.lower() in field_name_lower:
-                # Check if this is a number field (time fields are stored as numbers in minutes)
-                if 'number_value' in field:
-                    minutes = field.get('number_value')
-                    if minutes is not None:
-                        return convert_minutes_to_hhmmss(minutes)
-                # Fallback to text_value if present (though unlikely for time fields)
-                elif 'text_value' in field:
-                    value = field.get('text_value')
-                    if value:
-                        # Try to parse if it's already in a time format
-                        return str(value).strip() if str(value).strip() else None
-        elif hasattr(field, 'name') and field_name.lower() in field.name.lower():
+            # Check if this is a number field (time fields are stored as numbers in minutes)
+            if 'number_value' in field:
+                minutes = field.get('number_value')
+                if minutes is not None:
+                    return convert_minutes_to_hhmmss(minutes)
+            # Fallback to text_value if present (though unlikely for time fields)
+            elif 'text_value' in field:
+                value = field.get('text_value')
+                if value:
+                    # Try to parse if it's already in a time format
+                    return str(value).strip() if str(value).strip() else None
+        else:
             if hasattr(field, 'number_value'):
                 minutes = field.number_value
                 if minutes is not None:
@@ -1,6 +1,7 @@
 """
 Mapping functions for transforming Asana fields to Scoro fields
 """
+from functools import lru_cache
 from typing import Optional
 from config import VALID_SCORO_USERS, USER_MAPPING
 
@@ -57,6 +58,11 @@ CATEGORY_MAPPING = {
     'Website Updates': 'Website - SEO',
 }
 
+# Lowercased CATEGORY_MAPPING for the case-insensitive fallback (first entry wins, as in a scan)
+_CATEGORY_MAPPING_LOWER = {}
+for _asana_category, _scoro_activity in CATEGORY_MAPPING.items():
+    _CATEGORY_MAPPING_LOWER.setdefault(_asana_category.lower(), _scoro_activity)
+
 
 def improve_misc_tracking(title: str) -> str:
     """Improve Misc tracking based on title analysis"""
@@ -214,18 +220,18 @@ def smart_map_activity_and_tracking(title: str, current_activity: Optional[str],
     if activity in CATEGORY_MAPPING:
         return CATEGORY_MAPPING[activity]
     
-    # Try case-insensitive match
-    activity_lower = activity.lower()
-    for asana_category, scoro_activity in CATEGORY_MAPPING.items():
-        if asana_category.lower() == activity_lower:
-            return scoro_activity
-    
-    # If no mapping found, return 'Other'
-    return 'Other'
+    # Try case-insensitive match; if no mapping found, return 'Other'
+    return _CATEGORY_MAPPING_LOWER.get(activity.lower(), 'Other')
 
 
+@lru_cache(maxsize=4096)
 def validate_user(user_name: Optional[str], default_to_tom: bool = False) -> str:
-    """Validate and map user name to valid Scoro user"""
+    """
+    Validate and map user name to valid Scoro user
+    
+    Cached: it runs several times per task on a handful of distinct names, and the user
+    lists it checks against are constants.
+    """
     if not user_name or user_name.strip() == '':
         return 'Tom Sanpakit' if default_to_tom else ''
     
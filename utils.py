@@ -3,16 +3,19 @@ Utility functions for rate limiting, retry logic, and logging
 """
 import sys
 import os
+import atexit
 import logging
+import random
 import time
 from datetime import datetime
 from typing import Callable
 from functools import wraps
+from logging.handlers import MemoryHandler
 
 import requests
 from asana.rest import ApiException
 
-from config import RATE_LIMIT_DELAY, MAX_RETRIES, RETRY_DELAY, RETRY_BACKOFF, CONSOLE_LOG_LEVEL
+from config import RATE_LIMIT_DELAY, MAX_RETRIES, RETRY_DELAY, RETRY_BACKOFF, CONSOLE_LOG_LEVEL, LOG_BUFFER_CAPACITY
 
 # Configure Windows console for UTF-8 encoding to handle special characters
 if sys.platform == 'win32':
@@ -42,14 +45,28 @@ formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
 file_handler.setFormatter(formatter)
 console_handler.setFormatter(formatter)
 
+# Buffer file log records in memory so they are written in batches instead of one write per record
+# Records are flushed when the buffer is full, on ERROR or higher, and at interpreter exit
+buffered_file_handler = MemoryHandler(
+    capacity=LOG_BUFFER_CAPACITY,
+    flushLevel=logging.ERROR,
+    target=file_handler
+)
+atexit.register(buffered_file_handler.flush)
+
 # Configure root logger with DEBUG level (so file handler captures all levels)
 logging.basicConfig(
     level=logging.DEBUG,
-    handlers=[file_handler, console_handler]
+    handlers=[buffered_file_handler, console_handler]
 )
 logger = logging.getLogger(__name__)
 
 
+def flush_logs():
+    """Write any buffered log records to the log file"""
+    buffered_file_handler.flush()
+
+
 def rate_limit(func: Callable) -> Callable:
     """Decorator to add rate limiting to API calls"""
     @wraps(func)
@@ -114,8 +131,12 @@ def retry_with_backoff(max_retries: int = MAX_RETRIES, delay: float = RETRY_DELA
                             retry_reason = f"Connection issue: {error_str[:100]}"
                     
                     if is_retryable:
-                        logger.warning(f"Retryable error ({retry_reason}) in {func.__name__}, retrying in {current_delay}s (attempt {retries}/{max_retries})...")
-                        time.sleep(current_delay)
+                        # Add random jitter on rate limits so parallel workers don't all retry at the same moment
+                        sleep_time = current_delay
+                        if status == 429:
+                            sleep_time += random.uniform(0, current_delay)
+                        logger.warning(f"Retryable error ({retry_reason}) in {func.__name__}, retrying in {sleep_time:.1f}s (attempt {retries}/{max_retries})...")
+                        time.sleep(sleep_time)
                         current_delay *= backoff
                     else:
                         # Non-retryable error, raise immediately
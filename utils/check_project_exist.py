@@ -88,7 +88,8 @@ def get_scoro_project_names(scoro_client: ScoroClient) -> Set[str]:
             
             try:
                 headers = {'Content-Type': 'application/json'}
-                response = requests.post(
+                # Reuse the client's pooled session so every page shares one keep-alive connection
+                response = scoro_client.session.post(
                     f'{base_url}{endpoint}',
                     headers=headers,
                     json=request_body